@@ -0,0 +1,160 @@
+"""Rerun time and memory with many browser sessions open at once.
+
+Opens ``--sessions`` AppTest sessions of an entry script in one process, as
+a Streamlit server would hold them, all sharing the process-wide caches, and
+reruns them round-robin. (AppTest swaps a global runtime on every run, so it
+cannot drive sessions from several threads; on a server the reruns would
+mostly take turns on the interpreter lock anyway.) Session ``i`` shows page
+``i`` modulo the page count under the region option after that, so the
+sessions spread over every page and region. A first session is run alone
+beforehand to load the data; its time is reported as the cold start.
+
+The report gives p50/p95/max of every session's timed reruns, the wall time
+of the rerun rounds, and the process RSS with the data loaded, with all
+sessions still open, and at its peak.
+
+Usage: python benchmarks/concurrent_sessions.py [--script AsiaVsAmerica.py]
+           [--sessions 50] [--reruns 10] [--json report.json]
+           [--baseline old.json] [--data-dir DIR]
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import time
+from pathlib import Path
+
+import pandas as pd
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(ROOT))
+
+TIMEOUT = 300
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+
+def _rss_mb():
+    """Current resident set size (Linux), or None where /proc is missing"""
+    try:
+        status = Path("/proc/self/status").read_text()
+    except OSError:
+        return None
+    for line in status.splitlines():
+        if line.startswith("VmRSS:"):
+            return round(int(line.split()[1]) / 1024, 1)
+    return None
+
+
+def open_session(script, page, region):
+    at = AppTest.from_file(str(script), default_timeout=TIMEOUT)
+    at.session_state["current_page"] = page
+    at.run()
+    at.selectbox(key="global_region_filter").set_value(region)
+    at.run()
+    return at
+
+
+def build_report(script, sessions, reruns):
+    # Imported here so --data-dir is set before crime_dashboard.store loads
+    from crime_dashboard.app import PAGES
+
+    start = time.perf_counter()
+    at = AppTest.from_file(str(script), default_timeout=TIMEOUT)
+    at.run()
+    cold_ms = (time.perf_counter() - start) * 1e3
+    regions = list(at.selectbox(key="global_region_filter").options)
+    rss_loaded = _rss_mb()
+
+    pages = list(PAGES)
+    plan = [(pages[i % len(pages)], regions[i // len(pages) % len(regions)])
+            for i in range(sessions)]
+    open_sessions = [open_session(script, page, region)
+                     for page, region in plan]
+
+    times = []
+    start = time.perf_counter()
+    for _ in range(reruns):
+        for at in open_sessions:
+            run_start = time.perf_counter()
+            at.run()
+            times.append((time.perf_counter() - run_start) * 1e3)
+    wall_s = time.perf_counter() - start
+    # Every AppTest is still referenced here, like sessions left open
+    rss_open = _rss_mb()
+    for (page, region), at in zip(plan, open_sessions):
+        if at.exception:
+            raise RuntimeError(f"{page} / {region}: {at.exception[0].value}")
+
+    return {
+        "script": script.name,
+        "streamlit": streamlit.__version__,
+        "pandas": pd.__version__,
+        "sessions": sessions,
+        "reruns": reruns,
+        "cold_ms": round(cold_ms, 1),
+        "p50_ms": round(_percentile(times, 0.50), 2),
+        "p95_ms": round(_percentile(times, 0.95), 2),
+        "max_ms": round(max(times), 2),
+        "wall_s": round(wall_s, 2),
+        "rss_loaded_mb": rss_loaded,
+        "rss_open_mb": rss_open,
+        # ru_maxrss is KiB on Linux
+        "max_rss_mb": round(
+            resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+METRICS = ("cold_ms", "p50_ms", "p95_ms", "max_ms", "wall_s",
+           "rss_loaded_mb", "rss_open_mb", "max_rss_mb")
+
+
+def format_report(report, baseline=None):
+    lines = [f"{report['script']}  streamlit {report['streamlit']}  "
+             f"pandas {report['pandas']}  {report['sessions']} sessions x "
+             f"{report['reruns']} reruns", ""]
+    header = f"{'metric':<16} {'value':>10}"
+    if baseline:
+        header += f" {'baseline':>10} {'ratio':>7}"
+    lines.append(header)
+    for metric in METRICS:
+        value = report[metric]
+        line = f"{metric:<16} {value if value is not None else '-':>10}"
+        old = baseline.get(metric) if baseline else None
+        if old and value is not None:
+            line += f" {old:>10} {value / old:>6.2f}x"
+        lines.append(line)
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default="AsiaVsAmerica.py",
+                        help="entry script, relative to the repository root")
+    parser.add_argument("--sessions", type=int, default=50)
+    parser.add_argument("--reruns", type=int, default=10,
+                        help="timed reruns per session")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--baseline", help="earlier --json report to compare to")
+    parser.add_argument("--data-dir",
+                        help="directory of dataset CSVs to load instead of data/")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        # Read by crime_dashboard.store when the entry script imports it
+        os.environ["CRIME_DASHBOARD_DATA_DIR"] = str(Path(args.data_dir).resolve())
+
+    logging.disable(logging.WARNING)
+    report = build_report(ROOT / args.script, args.sessions, args.reruns)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    print(format_report(report, baseline))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2,
+                                              ensure_ascii=False))
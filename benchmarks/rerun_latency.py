@@ -0,0 +1,221 @@
+"""Rerun latency and memory for every page x region x filter combination.
+
+Drives an entry script headlessly with Streamlit's AppTest. For each
+scenario the page, global region and page filters are set, then the script
+is rerun ``--repeat`` times with unchanged state; the report gives p50/p95
+wall time of those reruns, the time of the first rerun after the filters
+changed, and the peak traced allocation and retained blocks of one extra
+rerun under tracemalloc.
+
+Usage: python benchmarks/rerun_latency.py [--script AsiaVsAmerica.py]
+           [--repeat 20] [--pages Overview,Gender] [--json report.json]
+           [--baseline old.json] [--tolerance 1.25] [--data-dir DIR]
+
+With ``--baseline`` the p50 of each scenario is compared to an earlier
+report and the script exits non-zero if any is slower than ``--tolerance``
+times the old value. ``--data-dir`` runs against another copy of the CSVs,
+e.g. one written by ``synthetic_data.py``.
+"""
+import argparse
+import json
+import logging
+import os
+import resource
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+import pandas as pd
+import streamlit
+from streamlit.testing.v1 import AppTest
+
+ROOT = Path(__file__).resolve().parent.parent
+
+# Page title -> filter combinations; each maps a widget key to the index of
+# the option to pick (keys with too few options are skipped)
+SCENARIOS = {
+    "🏠 Home": [{}],
+    "📈 Overview": [
+        {},
+        {"year": -1},
+        {"year": -1, "subregion": 1, "crime_type": 1},
+    ],
+    "👥 Gender Analysis": [
+        {},
+        {"year_gender": -1, "category_gender": 1},
+    ],
+    "🔍 Trafficking Analysis": [
+        {},
+        {"year_trafficking": -1, "indicator": 1},
+    ],
+    "⚖️ Conviction Outcomes": [
+        {},
+        {"year_conviction": -1, "crime_cat": 1, "subregion_conv": 1},
+    ],
+    "🏛️ Justice System Capacity": [
+        {},
+        {"year_prosecution": -1, "crime_prosecution": 1, "group": 1,
+         "subregion_pros": 1},
+    ],
+    "🛡️ Safety & SDG Indicators": [
+        *({"sdg_indicator": i} for i in range(6)),
+        {"sdg_indicator": 0, "sdg_gender": 1, "sdg_country": 1},
+    ],
+}
+
+TIMEOUT = 300
+
+
+def _percentile(values, q):
+    values = sorted(values)
+    return values[min(len(values) - 1, round(q * (len(values) - 1)))]
+
+
+def _apply_filters(at, filters):
+    """Pick the requested options; returns a label for the combination"""
+    picked = []
+    for key, index in filters.items():
+        widget = at.selectbox(key=key)
+        if len(widget.options) <= max(index, -index - 1):
+            continue
+        value = widget.options[index]
+        widget.set_value(value)
+        at.run()
+        picked.append(f"{key}={str(value)[:20]}")
+    return ",".join(picked) or "default"
+
+
+def _traced_rerun(at):
+    tracemalloc.start()
+    before = tracemalloc.take_snapshot()
+    at.run()
+    after = tracemalloc.take_snapshot()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    retained = sum(max(stat.count_diff, 0)
+                   for stat in after.compare_to(before, "filename"))
+    return peak, retained
+
+
+def run_scenario(script, page, region, filters, repeat):
+    at = AppTest.from_file(str(script), default_timeout=TIMEOUT)
+    at.session_state["current_page"] = page
+    at.run()
+    at.selectbox(key="global_region_filter").set_value(region)
+    at.run()
+
+    start = time.perf_counter()
+    label = _apply_filters(at, filters)
+    first_ms = (time.perf_counter() - start) * 1e3
+
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        at.run()
+        times.append((time.perf_counter() - start) * 1e3)
+    if at.exception:
+        raise RuntimeError(f"{page} / {region} / {label}: {at.exception[0].value}")
+
+    peak, retained = _traced_rerun(at)
+    return label, {
+        "p50_ms": round(_percentile(times, 0.50), 2),
+        "p95_ms": round(_percentile(times, 0.95), 2),
+        "first_ms": round(first_ms, 2),
+        "peak_alloc_kb": round(peak / 1024, 1),
+        "retained_blocks": retained,
+    }
+
+
+def build_report(script, repeat, pages=None):
+    at = AppTest.from_file(str(script), default_timeout=TIMEOUT)
+    at.run()
+    regions = list(at.selectbox(key="global_region_filter").options)
+
+    report = {
+        "script": script.name,
+        "streamlit": streamlit.__version__,
+        "pandas": pd.__version__,
+        "repeat": repeat,
+        "scenarios": {},
+    }
+    for page, combos in SCENARIOS.items():
+        if pages and not any(p in page for p in pages):
+            continue
+        for region in regions:
+            for filters in combos:
+                label, result = run_scenario(script, page, region, filters,
+                                             repeat)
+                report["scenarios"][f"{page}|{region}|{label}"] = result
+    # ru_maxrss is KiB on Linux
+    report["max_rss_mb"] = round(
+        resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1)
+    return report
+
+
+def format_report(report, baseline=None):
+    lines = [f"{report['script']}  streamlit {report['streamlit']}  "
+             f"pandas {report['pandas']}  repeat {report['repeat']}", ""]
+    header = (f"{'scenario':<70} {'p50 ms':>8} {'p95 ms':>8} {'first ms':>9} "
+              f"{'peak KiB':>9} {'blocks':>7}")
+    if baseline:
+        header += f" {'vs base':>8}"
+    lines.append(header)
+    for name, r in report["scenarios"].items():
+        line = (f"{name:<70} {r['p50_ms']:>8.1f} {r['p95_ms']:>8.1f} "
+                f"{r['first_ms']:>9.1f} {r['peak_alloc_kb']:>9.1f} "
+                f"{r['retained_blocks']:>7}")
+        old = baseline["scenarios"].get(name) if baseline else None
+        if old:
+            line += f" {r['p50_ms'] / old['p50_ms']:>7.2f}x"
+        lines.append(line)
+    lines.append("")
+    lines.append(f"max RSS {report['max_rss_mb']} MB")
+    return "\n".join(lines)
+
+
+def regressions(report, baseline, tolerance):
+    """Scenarios whose p50 is more than ``tolerance`` times the baseline's"""
+    slower = []
+    for name, r in report["scenarios"].items():
+        old = baseline["scenarios"].get(name)
+        if old and r["p50_ms"] > old["p50_ms"] * tolerance:
+            slower.append(name)
+    return slower
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--script", default="AsiaVsAmerica.py",
+                        help="entry script, relative to the repository root")
+    parser.add_argument("--repeat", type=int, default=20,
+                        help="timed reruns per scenario")
+    parser.add_argument("--pages",
+                        help="comma-separated substrings of page titles to run")
+    parser.add_argument("--json", help="also write the report to this file")
+    parser.add_argument("--baseline", help="earlier --json report to compare to")
+    parser.add_argument("--tolerance", type=float, default=1.25,
+                        help="allowed p50 slowdown against --baseline")
+    parser.add_argument("--data-dir",
+                        help="directory of dataset CSVs to load instead of data/")
+    args = parser.parse_args()
+
+    if args.data_dir:
+        # Read by crime_dashboard.store when the entry script imports it
+        os.environ["CRIME_DASHBOARD_DATA_DIR"] = str(Path(args.data_dir).resolve())
+
+    logging.disable(logging.WARNING)
+    report = build_report(ROOT / args.script, args.repeat,
+                          args.pages.split(",") if args.pages else None)
+    baseline = json.loads(Path(args.baseline).read_text()) if args.baseline else None
+    print(format_report(report, baseline))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2,
+                                              ensure_ascii=False))
+    if baseline:
+        slower = regressions(report, baseline, args.tolerance)
+        if slower:
+            print(f"\n{len(slower)} scenario(s) slower than "
+                  f"{args.tolerance}x baseline:")
+            print("\n".join(f"  {name}" for name in slower))
+            sys.exit(1)
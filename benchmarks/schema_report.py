@@ -0,0 +1,111 @@
+"""Memory and filter-latency report: object-string columns vs the typed schema.
+
+"Before" reads each CSV with its dimension columns as Python-object strings
+and Year as int64, which is how the dashboards held them originally.
+"After" is the frame returned by ``crime_dashboard.store.load_dataset``.
+Both sides run the same filters and groupbys the page branches use.
+
+Usage: python benchmarks/schema_report.py [--json report.json]
+"""
+import argparse
+import json
+import sys
+import timeit
+from pathlib import Path
+
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crime_dashboard import schema, store  # noqa: E402
+
+REPEAT = 7
+
+
+def _object_frame(name):
+    df = pd.read_csv(store.DATA_DIR / store.DATASETS[name])
+    for column in schema.CATEGORICAL_COLUMNS:
+        if column in df.columns:
+            df[column] = df[column].astype(object)
+    return df
+
+
+def _operations(df):
+    """Filters and groupbys representative of the page branches"""
+    region = df["Region"].dropna().iloc[0]
+    ops = {
+        "region ==": lambda: df[df["Region"] == region],
+        "region isin": lambda: df[df["Region"].isin(["Americas", "Asia"])],
+        "year ==": lambda: df[df["Year"] == df["Year"].iloc[0]],
+        "groupby Country size": lambda: df.groupby("Country", observed=True).size(),
+    }
+    if "Category" in df.columns:
+        category = df["Category"].dropna().iloc[0]
+        ops["category =="] = lambda: df[df["Category"] == category]
+        ops["groupby Year,Category size"] = lambda: df.groupby(
+            ["Year", "Category"], observed=True).size()
+    return ops
+
+
+def _median_us(fn):
+    number = 20
+    times = timeit.repeat(fn, number=number, repeat=REPEAT)
+    return sorted(times)[REPEAT // 2] / number * 1e6
+
+
+def build_report():
+    report = {"pandas": pd.__version__, "datasets": {}}
+    for name, filename in store.DATASETS.items():
+        if not (store.DATA_DIR / filename).exists():
+            continue
+        before = _object_frame(name)
+        after = store.load_dataset(name)
+        if "Country" not in before.columns:
+            # SDG data names its country column Geo
+            before = before.rename(columns={"Geo": "Country"})
+            after = after.rename(columns={"Geo": "Country"})
+        entry = {
+            "rows": len(after),
+            "memory_bytes": {
+                "before": int(before.memory_usage(deep=True).sum()),
+                "after": int(after.memory_usage(deep=True).sum()),
+            },
+            "latency_us": {},
+        }
+        before_ops, after_ops = _operations(before), _operations(after)
+        for op in before_ops:
+            entry["latency_us"][op] = {
+                "before": round(_median_us(before_ops[op]), 1),
+                "after": round(_median_us(after_ops[op]), 1),
+            }
+        report["datasets"][name] = entry
+    return report
+
+
+def format_report(report):
+    lines = [f"pandas {report['pandas']}", ""]
+    lines.append(f"{'dataset':<12} {'rows':>8} {'mem before':>12} "
+                 f"{'mem after':>12} {'ratio':>7}")
+    for name, entry in report["datasets"].items():
+        mem = entry["memory_bytes"]
+        lines.append(f"{name:<12} {entry['rows']:>8,} {mem['before']:>12,} "
+                     f"{mem['after']:>12,} {mem['before'] / mem['after']:>6.1f}x")
+    lines.append("")
+    lines.append(f"{'dataset':<12} {'operation':<28} {'before us':>10} "
+                 f"{'after us':>10} {'speedup':>8}")
+    for name, entry in report["datasets"].items():
+        for op, t in entry["latency_us"].items():
+            lines.append(f"{name:<12} {op:<28} {t['before']:>10.1f} "
+                         f"{t['after']:>10.1f} {t['before'] / t['after']:>7.1f}x")
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--json", help="also write the report to this file")
+    args = parser.parse_args()
+
+    report = build_report()
+    print(format_report(report))
+    if args.json:
+        Path(args.json).write_text(json.dumps(report, indent=2))
@@ -0,0 +1,82 @@
+"""Scaled-up synthetic copies of the dashboard datasets for load testing.
+
+Every dataset in ``crime_dashboard.store.DATASETS`` is bootstrap-resampled
+to ``--scale`` times its row count: whole rows are drawn with replacement,
+so the columns, the Country/Region/Subregion/Category/Sex/Year vocabularies
+and their joint frequencies match the real data. Numeric ``VALUE``/``Value``
+columns get multiplicative lognormal noise so repeated rows are not exact
+duplicates; missing values stay missing. Files are written in chunks under
+the same names as the originals.
+
+Usage: python benchmarks/synthetic_data.py --scale 100 [--out DIR]
+           [--seed 0] [--chunk-rows 500000]
+
+Point the dashboard or a benchmark at the result with
+``CRIME_DASHBOARD_DATA_DIR=DIR`` (or ``rerun_latency.py --data-dir DIR``);
+the columnar store is built under ``DIR/_store`` on first load.
+"""
+import argparse
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from crime_dashboard import store  # noqa: E402
+
+VALUE_COLUMNS = ("VALUE", "Value")
+
+# Sigma of the lognormal noise applied to the value columns
+NOISE = 0.1
+
+
+def _jitter(values, rng):
+    noise = rng.lognormal(mean=0.0, sigma=NOISE, size=len(values))
+    return values * noise
+
+
+def write_dataset(name, scale, out_dir, rng, chunk_rows):
+    """Write ``scale`` times as many resampled rows of one dataset"""
+    base = pd.read_csv(store.DATA_DIR / store.DATASETS[name])
+    total = max(1, round(len(base) * scale))
+    path = out_dir / store.DATASETS[name]
+    written = 0
+    while written < total:
+        rows = min(chunk_rows, total - written)
+        chunk = base.iloc[rng.integers(0, len(base), size=rows)]
+        chunk = chunk.reset_index(drop=True)
+        for column in VALUE_COLUMNS:
+            if column in chunk.columns:
+                chunk[column] = _jitter(chunk[column].to_numpy(), rng)
+        chunk.to_csv(path, mode="w" if written == 0 else "a",
+                     header=written == 0, index=False)
+        written += rows
+    return len(base), total, path.stat().st_size
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--scale", type=float, required=True,
+                        help="row multiplier, e.g. 10, 100 or 1000")
+    parser.add_argument("--out", help="output directory "
+                        "(default data/synthetic_x<scale>)")
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--chunk-rows", type=int, default=500_000,
+                        help="rows generated and written at a time")
+    args = parser.parse_args()
+
+    out_dir = Path(args.out or store.DATA_DIR / f"synthetic_x{args.scale:g}")
+    out_dir.mkdir(parents=True, exist_ok=True)
+    rng = np.random.default_rng(args.seed)
+
+    print(f"{'dataset':<12} {'rows':>9} {'synthetic':>11} {'MB':>9} {'s':>7}")
+    for name in store.DATASETS:
+        start = time.perf_counter()
+        rows, total, size = write_dataset(name, args.scale, out_dir, rng,
+                                          args.chunk_rows)
+        print(f"{name:<12} {rows:>9} {total:>11} {size / 2**20:>9.1f} "
+              f"{time.perf_counter() - start:>7.2f}")
+    print(f"\nCRIME_DASHBOARD_DATA_DIR={out_dir}")
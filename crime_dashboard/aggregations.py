@@ -0,0 +1,38 @@
+"""Memoized aggregate tables shared by every session.
+
+Page branches describe what they need as a table builder plus the active
+filter values. The service keys the finished tables on (builder, dataset,
+region, filters), keeps the most recently used entries up to a fixed size,
+and counts hits, misses and evictions so the size can be tuned.
+"""
+from crime_dashboard import profiling
+from crime_dashboard.lru import LRUCache
+
+
+class AggregationService:
+    """Bounded LRU cache of finished aggregate tables"""
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    def tables(self, builder, dataset, region, frame, **filters):
+        """Return ``builder(frame, **filters)``, computing it only on a miss.
+
+        ``frame`` must be the ``dataset`` rows for ``region``, or the
+        bitmap index view of them the builder expects; it is only read when
+        the tables are not cached yet. The returned tables are
+        shared and must be treated as read-only.
+        """
+        key = (builder.__qualname__, dataset, region,
+               tuple(sorted(filters.items())))
+        with profiling.span('aggregate', builder.__name__):
+            return self._cache.get_or_build(key,
+                                            lambda: builder(frame, **filters))
+
+    def stats(self):
+        """Hit, miss and eviction counters plus the current fill level"""
+        return self._cache.stats()
+
+    def clear(self):
+        """Drop every cached table and reset the counters"""
+        self._cache.clear()
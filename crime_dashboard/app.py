@@ -0,0 +1,140 @@
+"""The crime statistics dashboard, shared by every entry script.
+
+``run(mode)`` renders one rerun: the stylesheet link (``static/``), header,
+global region filter and page navigation, then the current page from
+:mod:`crime_dashboard.pages`. Entry scripts only pick a
+:class:`crime_dashboard.modes.RegionMode`.
+
+The page is rendered as a fragment, so changing one of its filters reruns
+only the page body; the region filter and navigation rerun everything.
+"""
+import functools
+import hashlib
+from pathlib import Path
+
+import streamlit as st
+
+from crime_dashboard import data, navigation, profiling
+from crime_dashboard.pages import PAGES
+
+STYLESHEET = Path(__file__).resolve().parent.parent / "static" / "dashboard.css"
+
+
+@functools.lru_cache(maxsize=4)
+def _style_markup(static_serving, mtime_ns):
+    """Markup that applies the dashboard stylesheet.
+
+    With static file serving enabled (``.streamlit/config.toml``) this is a
+    ``<link>`` the browser fetches once and caches; the query string changes
+    with the file contents so an edited stylesheet isn't served stale.
+    Otherwise the stylesheet is inlined. ``mtime_ns`` (the file's
+    modification time) keys the cache, so an edit is picked up on the next
+    rerun.
+    """
+    css = STYLESHEET.read_text()
+    if static_serving:
+        version = hashlib.sha256(css.encode()).hexdigest()[:12]
+        return (f'<link rel="stylesheet" '
+                f'href="app/static/{STYLESHEET.name}?v={version}">')
+    return f"<style>\n{css}</style>"
+
+
+def run(mode):
+    """Render the dashboard for ``mode``"""
+    st.set_page_config(page_title=mode.page_title, layout="wide")
+
+    # Initialize session state for page navigation
+    if 'current_page' not in st.session_state:
+        st.session_state.current_page = navigation.HOME
+
+    profiling.start(st.session_state.current_page)
+    try:
+        with profiling.span('chrome'):
+            selected_region = _render_chrome(mode)
+        _render_page(mode, selected_region)
+    finally:
+        # Normally a no-op: the page finished the profile unless it raised
+        _finish_profile()
+
+
+def _finish_profile():
+    profiling.finish({'aggregations': data.aggregation_service().stats(),
+                      'figures': data.figure_cache().stats()})
+
+
+@st.fragment
+def _render_page(mode, selected_region):
+    """The current page; its own widgets rerun only this function"""
+    page = st.session_state.current_page
+    if not profiling.active():
+        # A fragment rerun doesn't pass through run()
+        profiling.start(page, scope='fragment')
+    try:
+        with profiling.span('page', page):
+            PAGES[page](mode, selected_region)
+    finally:
+        # Even when the page raises, so no stale timeline outlives the rerun
+        _finish_profile()
+
+
+def _render_chrome(mode):
+    """Stylesheet, header, region filter and navigation; returns the region"""
+    st.markdown(_style_markup(st.get_option("server.enableStaticServing"),
+                              STYLESHEET.stat().st_mtime_ns),
+                unsafe_allow_html=True)
+
+    st.markdown(f"""
+<div class="main-header">
+    <h1>{mode.title}</h1>
+    <p>{mode.subtitle}</p>
+</div>
+""",
+                unsafe_allow_html=True)
+
+    # Region Filter - white background applied via CSS
+    col1, col2, col3 = st.columns([2, 2, 6])
+    with col1:
+        region_options = list(data.region_options(mode.key))
+        selected_region = st.selectbox(mode.region_label,
+                                       region_options,
+                                       key="global_region_filter")
+
+    # Create custom tab navigation
+    st.markdown('<div class="custom-tabs">', unsafe_allow_html=True)
+    col1, col2, col3, col4, col5, col6, col7 = st.columns(7)
+    with col1:
+        st.button("🏠 Home", key="nav_home", use_container_width=True,
+                  on_click=navigation.go_to, args=(navigation.HOME,))
+    with col2:
+        st.button("📈 Overview", key="nav_overview", use_container_width=True,
+                  on_click=navigation.go_to, args=("📈 Overview",))
+    with col3:
+        st.button("👥 Gender", key="nav_gender", use_container_width=True,
+                  on_click=navigation.go_to, args=("👥 Gender Analysis",))
+    with col4:
+        st.button("🔍 Trafficking", key="nav_trafficking", use_container_width=True,
+                  on_click=navigation.go_to, args=("🔍 Trafficking Analysis",))
+    with col5:
+        st.button("⚖️ Conviction", key="nav_conviction", use_container_width=True,
+                  on_click=navigation.go_to, args=("⚖️ Conviction Outcomes",))
+    with col6:
+        st.button("🏛️ Justice", key="nav_justice", use_container_width=True,
+                  on_click=navigation.go_to, args=("🏛️ Justice System Capacity",))
+    with col7:
+        st.button("🛡️ Safety & SDG", key="nav_safety", use_container_width=True,
+                  on_click=navigation.go_to, args=("🛡️ Safety & SDG Indicators",))
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # Add active tab highlighting via JavaScript
+    st.markdown(f"""
+<script>
+const currentPage = "{st.session_state.current_page}";
+const buttons = document.querySelectorAll('.custom-tabs button');
+buttons.forEach(btn => {{
+    if (btn.textContent.includes(currentPage)) {{
+        btn.classList.add('active');
+    }}
+}});
+</script>
+""", unsafe_allow_html=True)
+    return selected_region
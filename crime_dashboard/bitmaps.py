@@ -0,0 +1,213 @@
+"""Bitmap indexes over the low-cardinality filter columns of a dataset.
+
+Each indexed value keeps a packed bitmap of its rows; a selection ANDs and
+ORs them and copies the matching rows out once.
+"""
+import numpy as np
+import pandas as pd
+
+from crime_dashboard import profiling
+
+# Filter columns worth a bitmap per value, where a dataset has them
+FILTER_COLUMNS = ('Region', 'TwoRegion', 'MappedRegion', 'Subregion',
+                  'Category', 'Year', 'Sex', 'Indicator', 'Group',
+                  'SeriesFlags')
+
+# Set bits in each possible byte, for counting rows without unpacking
+_POPCOUNT = np.array([bin(byte).count('1') for byte in range(256)],
+                     dtype=np.uint8)
+
+
+def _pack(mask):
+    return np.packbits(mask)
+
+
+def _temporary(array):
+    profiling.allocated('temp', array.nbytes)
+    return array
+
+
+def _column_bitmaps(values):
+    """Value -> packed bitmap of the rows holding it (missing values get none)"""
+    if hasattr(values, 'cat'):
+        codes, labels = values.cat.codes.to_numpy(), values.cat.categories
+    else:
+        codes, labels = pd.factorize(values)
+    bitmaps = {}
+    for code in np.unique(codes[codes >= 0]):
+        label = labels[code]
+        bitmaps[label.item() if hasattr(label, 'item') else label] = _pack(
+            codes == code)
+    return bitmaps
+
+
+class BitmapIndex:
+    """Packed per-value bitmaps of a frame's filter columns"""
+
+    def __init__(self, frame, columns=FILTER_COLUMNS, layout=None,
+                 _bitmaps=None, _base=None):
+        self.frame = frame
+        self.layout = layout
+        self._bitmaps = _bitmaps if _bitmaps is not None else {
+            column: _column_bitmaps(frame[column])
+            for column in columns if column in frame.columns}
+        # Packed bitmap every selection is AND-ed with; None keeps all rows
+        self._base = _base
+        # Layout regions making up exactly the rows of the view, or None
+        self._regions = self._aligned_regions(_base)
+
+    def _nbytes(self):
+        return (len(self.frame) + 7) // 8
+
+    def _empty(self, lo, hi):
+        return np.zeros(hi - lo, dtype=np.uint8)
+
+    def _aligned_regions(self, base):
+        """Regions of the layout whose rows are exactly the rows in ``base``"""
+        if self.layout is None or not self.layout.columns:
+            return None
+        selected = None if base is None else np.unpackbits(
+            base, count=len(self.frame)).view(bool)
+        regions, covered = [], 0
+        for region in self.layout.values(self.layout.columns[0]):
+            start, stop = self.layout.span(region)
+            count = stop - start if selected is None else int(
+                np.count_nonzero(selected[start:stop]))
+            if count == stop - start:
+                regions.append(region)
+                covered += count
+            elif count:
+                return None
+        total = len(self.frame) if selected is None else int(
+            np.count_nonzero(selected))
+        return regions if covered == total else None
+
+    def values(self, column):
+        """Indexed values of ``column`` that occur in at least one row"""
+        return list(self._bitmaps[column])
+
+    def _bitmap(self, column, value, lo, hi):
+        """Bytes ``lo:hi`` of the packed bitmap of ``column == value``"""
+        # A list of values is OR-ed (isin); an indexed single value returns
+        # a view of the index's own bitmap, which must not be written to
+        if isinstance(value, (list, tuple, set)):
+            bitmap = _temporary(self._empty(lo, hi))
+            for item in value:
+                bitmap |= self._bitmap(column, item, lo, hi)
+            return bitmap
+        if column in self._bitmaps:
+            bitmap = self._bitmaps[column].get(value)
+            return _temporary(self._empty(lo, hi)) if bitmap is None else (
+                bitmap[lo:hi])
+        values = self.frame[column].iloc[lo * 8:hi * 8]
+        mask = _temporary((values == value).to_numpy())
+        return _temporary(_pack(mask))
+
+    def _combine(self, filters, lo, hi, base):
+        """AND of ``base`` and the filters over bytes ``lo:hi``, or None"""
+        # The first AND copies, later ones are in place: the index's own
+        # bitmaps are never written to
+        combined, owned = None if base is None else base[lo:hi], False
+        for column, value in filters.items():
+            if value is None:
+                continue
+            bitmap = self._bitmap(column, value, lo, hi)
+            if combined is None:
+                combined = bitmap
+            elif owned:
+                combined &= bitmap
+            else:
+                combined = _temporary(combined & bitmap)
+                owned = True
+        return combined
+
+    def _spans(self, filters):
+        """Layout row ranges of the leading filters, and the other filters"""
+        rest = {column: value for column, value in filters.items()
+                if value is not None}
+        prefix = []
+        for column in self.layout.columns[1:]:
+            value = rest.get(column)
+            if value is None or isinstance(value, (list, tuple, set)):
+                break
+            prefix.append(rest.pop(column))
+        if not prefix and self._base is None:
+            spans = [(0, len(self.frame))]
+        else:
+            spans = [self.layout.span(region, *prefix)
+                     for region in self._regions]
+        return [(start, stop) for start, stop in spans if stop > start], rest
+
+    def _span_rows(self, spans, filters):
+        """Positions of the rows within ``spans`` matching the filters"""
+        pieces = []
+        for start, stop in spans:
+            if not filters:
+                pieces.append(_temporary(np.arange(start, stop)))
+                continue
+            # The ranges are exactly the view's rows, so the base is not needed
+            lo, hi = start // 8, (stop + 7) // 8
+            combined = self._combine(filters, lo, hi, None)
+            rows = _temporary(np.flatnonzero(
+                _temporary(np.unpackbits(combined)))) + lo * 8
+            pieces.append(rows[np.searchsorted(rows, start):
+                               np.searchsorted(rows, stop)])
+        if not pieces:
+            return np.empty(0, dtype=np.intp)
+        return pieces[0] if len(pieces) == 1 else np.concatenate(pieces)
+
+    def restrict(self, **filters):
+        """View whose selections only ever return rows matching ``filters``"""
+        return BitmapIndex(self.frame, layout=self.layout,
+                           _bitmaps=self._bitmaps,
+                           _base=self._combine(filters, 0, self._nbytes(),
+                                               self._base))
+
+    def rows(self, **filters):
+        """Positions of the rows matching every filter"""
+        if self._regions is not None:
+            spans, rest = self._spans(filters)
+            return self._span_rows(spans, rest)
+        combined = self._combine(filters, 0, self._nbytes(), self._base)
+        if combined is None:
+            return _temporary(np.arange(len(self.frame)))
+        unpacked = _temporary(np.unpackbits(combined, count=len(self.frame)))
+        return _temporary(np.flatnonzero(unpacked))
+
+    def count(self, **filters):
+        """Number of rows matching every filter, without copying any"""
+        if self._regions is not None:
+            spans, rest = self._spans(filters)
+            if not rest:
+                return sum(stop - start for start, stop in spans)
+            return len(self._span_rows(spans, rest))
+        combined = self._combine(filters, 0, self._nbytes(), self._base)
+        if combined is None:
+            return len(self.frame)
+        return int(_temporary(_POPCOUNT[combined]).sum(dtype=np.int64))
+
+    def select(self, **filters):
+        """Rows matching every filter (a value, a list of values, or None).
+
+        May be the frame itself or a slice of it, so treat it as read-only.
+        """
+        with profiling.span('filter', ','.join(
+                column for column, value in filters.items()
+                if value is not None)):
+            if self._base is None and all(
+                    value is None for value in filters.values()):
+                return self.frame
+            if self._regions is not None:
+                spans, rest = self._spans(filters)
+                if not rest and len(spans) == 1:
+                    start, stop = spans[0]
+                    return self.frame.iloc[start:stop]
+                rows = self._span_rows(spans, rest)
+            else:
+                rows = self.rows(**filters)
+            selected = self.frame.take(rows)
+            if profiling.active():
+                profiling.allocated('copied',
+                                    int(selected.memory_usage().sum()))
+            return selected
+
@@ -0,0 +1,214 @@
+"""ISO 3166-1 alpha-3 codes for the dataset country names.
+
+The datasets use UN M49 country names (e.g. "Türkiye", "Netherlands (Kingdom
+of the)", "United Kingdom (Scotland)"), several of which Plotly's
+``locationmode='country names'`` lookup does not recognise and silently
+leaves off the map. Names are resolved here once per distinct value at
+load, into an ``ISO3`` column the map plots with ``locationmode='ISO-3'``.
+
+Run ``python -m crime_dashboard.countries`` to list names with no code.
+"""
+import logging
+
+from crime_dashboard.regions import map_categories
+
+logger = logging.getLogger(__name__)
+
+# Dataset country name -> ISO 3166-1 alpha-3 code. Sub-national reporting
+# units map to their country; Kosovo uses the common user-assigned XKX.
+COUNTRY_ISO3 = {
+    'Albania': 'ALB',
+    'Algeria': 'DZA',
+    'Andorra': 'AND',
+    'Antigua and Barbuda': 'ATG',
+    'Argentina': 'ARG',
+    'Armenia': 'ARM',
+    'Australia': 'AUS',
+    'Austria': 'AUT',
+    'Azerbaijan': 'AZE',
+    'Bahamas': 'BHS',
+    'Bahrain': 'BHR',
+    'Bangladesh': 'BGD',
+    'Barbados': 'BRB',
+    'Belarus': 'BLR',
+    'Belgium': 'BEL',
+    'Belize': 'BLZ',
+    'Benin': 'BEN',
+    'Bermuda': 'BMU',
+    'Bhutan': 'BTN',
+    'Bolivia (Plurinational State of)': 'BOL',
+    'Bosnia and Herzegovina': 'BIH',
+    'Botswana': 'BWA',
+    'Brazil': 'BRA',
+    'Brunei Darussalam': 'BRN',
+    'Bulgaria': 'BGR',
+    'Burkina Faso': 'BFA',
+    'Burundi': 'BDI',
+    'Cabo Verde': 'CPV',
+    'Cameroon': 'CMR',
+    'Canada': 'CAN',
+    'Chile': 'CHL',
+    'China': 'CHN',
+    'China, Hong Kong Special Administrative Region': 'HKG',
+    'China, Macao Special Administrative Region': 'MAC',
+    'Colombia': 'COL',
+    'Costa Rica': 'CRI',
+    'Croatia': 'HRV',
+    'Cyprus': 'CYP',
+    'Czechia': 'CZE',
+    'Denmark': 'DNK',
+    'Djibouti': 'DJI',
+    'Dominica': 'DMA',
+    'Dominican Republic': 'DOM',
+    'Ecuador': 'ECU',
+    'Egypt': 'EGY',
+    'El Salvador': 'SLV',
+    'Estonia': 'EST',
+    'Eswatini': 'SWZ',
+    'Faroe Islands': 'FRO',
+    'Finland': 'FIN',
+    'France': 'FRA',
+    'Georgia': 'GEO',
+    'Germany': 'DEU',
+    'Ghana': 'GHA',
+    'Greece': 'GRC',
+    'Grenada': 'GRD',
+    'Guatemala': 'GTM',
+    'Guinea': 'GIN',
+    'Guinea-Bissau': 'GNB',
+    'Guyana': 'GUY',
+    'Haiti': 'HTI',
+    'Holy See': 'VAT',
+    'Honduras': 'HND',
+    'Hungary': 'HUN',
+    'Iceland': 'ISL',
+    'India': 'IND',
+    'Indonesia': 'IDN',
+    'Iraq (Central Iraq)': 'IRQ',
+    'Ireland': 'IRL',
+    'Israel': 'ISR',
+    'Italy': 'ITA',
+    'Jamaica': 'JAM',
+    'Japan': 'JPN',
+    'Jordan': 'JOR',
+    'Kazakhstan': 'KAZ',
+    'Kenya': 'KEN',
+    'Kosovo under UNSCR 1244': 'XKX',
+    'Kuwait': 'KWT',
+    'Kyrgyzstan': 'KGZ',
+    'Latvia': 'LVA',
+    'Lebanon': 'LBN',
+    'Lesotho': 'LSO',
+    'Liechtenstein': 'LIE',
+    'Lithuania': 'LTU',
+    'Luxembourg': 'LUX',
+    'Madagascar': 'MDG',
+    'Malaysia': 'MYS',
+    'Maldives': 'MDV',
+    'Malta': 'MLT',
+    'Mauritius': 'MUS',
+    'Mexico': 'MEX',
+    'Monaco': 'MCO',
+    'Mongolia': 'MNG',
+    'Montenegro': 'MNE',
+    'Morocco': 'MAR',
+    'Mozambique': 'MOZ',
+    'Myanmar': 'MMR',
+    'Namibia': 'NAM',
+    'Nepal': 'NPL',
+    'Netherlands (Kingdom of the)': 'NLD',
+    'New Zealand': 'NZL',
+    'Nicaragua': 'NIC',
+    'Nigeria': 'NGA',
+    'North Macedonia': 'MKD',
+    'Norway': 'NOR',
+    'Oman': 'OMN',
+    'Pakistan': 'PAK',
+    'Panama': 'PAN',
+    'Paraguay': 'PRY',
+    'Peru': 'PER',
+    'Philippines': 'PHL',
+    'Poland': 'POL',
+    'Portugal': 'PRT',
+    'Puerto Rico': 'PRI',
+    'Qatar': 'QAT',
+    'Republic of Korea': 'KOR',
+    'Republic of Moldova': 'MDA',
+    'Romania': 'ROU',
+    'Russian Federation': 'RUS',
+    'Rwanda': 'RWA',
+    'Saint Kitts and Nevis': 'KNA',
+    'Saint Lucia': 'LCA',
+    'Saint Vincent and the Grenadines': 'VCT',
+    'Sao Tome and Principe': 'STP',
+    'Saudi Arabia': 'SAU',
+    'Senegal': 'SEN',
+    'Serbia': 'SRB',
+    'Sierra Leone': 'SLE',
+    'Singapore': 'SGP',
+    'Slovakia': 'SVK',
+    'Slovenia': 'SVN',
+    'Solomon Islands': 'SLB',
+    'South Africa': 'ZAF',
+    'Spain': 'ESP',
+    'Sri Lanka': 'LKA',
+    'State of Palestine': 'PSE',
+    'Sudan': 'SDN',
+    'Suriname': 'SUR',
+    'Sweden': 'SWE',
+    'Switzerland': 'CHE',
+    'Syrian Arab Republic': 'SYR',
+    'Tajikistan': 'TJK',
+    'Thailand': 'THA',
+    'Timor-Leste': 'TLS',
+    'Togo': 'TGO',
+    'Trinidad and Tobago': 'TTO',
+    'Tunisia': 'TUN',
+    'Turkmenistan': 'TKM',
+    'Türkiye': 'TUR',
+    'Uganda': 'UGA',
+    'Ukraine': 'UKR',
+    'United Arab Emirates': 'ARE',
+    'United Kingdom (England and Wales)': 'GBR',
+    'United Kingdom (Northern Ireland)': 'GBR',
+    'United Kingdom (Scotland)': 'GBR',
+    'United Republic of Tanzania': 'TZA',
+    'United States of America': 'USA',
+    'Uruguay': 'URY',
+    'Uzbekistan': 'UZB',
+    'Venezuela (Bolivarian Republic of)': 'VEN',
+    'Yemen': 'YEM',
+    'Zimbabwe': 'ZWE',
+}
+
+
+def unmatched(values):
+    """Names among a categorical Series' categories that have no ISO-3 code"""
+    return sorted(name for name in values.cat.categories
+                  if name not in COUNTRY_ISO3)
+
+
+def iso3_codes(values):
+    """ISO3 column for a categorical country-name Series.
+
+    Names without a code become missing (and are logged once per call),
+    so the map leaves them out visibly rather than by guesswork.
+    """
+    missing = unmatched(values.cat.remove_unused_categories())
+    if missing:
+        logger.warning("No ISO-3 code for %d country name(s): %s",
+                       len(missing), ", ".join(missing))
+    return map_categories(values, COUNTRY_ISO3)
+
+
+if __name__ == "__main__":
+    from crime_dashboard import store
+
+    for name in store.DATASETS:
+        df = store.load_dataset(name)
+        column = 'Geo' if 'Geo' in df.columns else 'Country'
+        countries = df[column].cat.remove_unused_categories()
+        missing = unmatched(countries)
+        print(f"{name:<12} {len(countries.cat.categories):>4} names  "
+              f"{len(missing):>3} unmatched"
+              + (f": {', '.join(missing)}" if missing else ""))
@@ -0,0 +1,62 @@
+"""Precomputed count cubes.
+
+A cube holds the number of rows for every observed combination of a fixed
+set of dimension columns, missing values included, so :meth:`total` and
+:meth:`distinct` see every row. Filtering a cube and rolling it up to one
+dimension gives the same counts as filtering the raw rows and calling
+``groupby(dim).size()`` (or ``value_counts()``), missing labels left out,
+but only touches one row per combination.
+"""
+import numpy as np
+
+from crime_dashboard import profiling
+
+
+class CountCube:
+    """Row counts of a dataset over a fixed set of dimensions"""
+
+    def __init__(self, cells, dims):
+        self.cells = cells
+        self.dims = list(dims)
+
+    @classmethod
+    def from_frame(cls, df, dims):
+        """Build the cube for ``df`` over the ``dims`` columns"""
+        cells = df.groupby(list(dims), observed=True, dropna=False).size()
+        return cls(cells.reset_index(name='count'), dims)
+
+    def slice(self, **filters):
+        """Keep the cells matching every filter.
+
+        Each filter is a single value, a list of accepted values, or
+        ``None`` to leave that dimension unfiltered.
+        """
+        with profiling.span('filter', 'cube'):
+            mask = np.ones(len(self.cells), dtype=bool)
+            for dim, value in filters.items():
+                if value is None:
+                    continue
+                column = self.cells[dim]
+                if isinstance(value, (list, tuple, set)):
+                    mask &= column.isin(value).to_numpy()
+                else:
+                    mask &= (column == value).to_numpy()
+            return CountCube(self.cells[mask], self.dims)
+
+    def rollup(self, dim):
+        """Counts per value of ``dim``, as ``groupby(dim).size()`` would give.
+
+        Rows with a missing ``dim`` are left out, so no chart gets a NaN bar.
+        """
+        with profiling.span('groupby', f'cube {dim}'):
+            counts = self.cells.groupby(dim, observed=True)['count'].sum()
+            return counts.reset_index(name='count')
+
+    def total(self):
+        """Number of rows in the slice"""
+        return int(self.cells['count'].sum())
+
+    def distinct(self, dim):
+        """Number of distinct values of ``dim`` present in the slice"""
+        return self.cells[dim].nunique(dropna=False)
+
@@ -0,0 +1,139 @@
+"""Streamlit-cached data access shared by every page and entry script.
+
+Datasets are loaded lazily, one at a time, the first time a page needs
+them, and held once per process: every session and rerun reads the same
+frames, so they are frozen read-only (see ``frozen``) once every derived
+column has been added. Bitmap indexes, region partitions, the selectbox
+option values, the offences count cube and the aggregate/figure memos are
+process-wide resources keyed by region mode where the mode matters, so one
+set of caches serves every script.
+"""
+import streamlit as st
+
+from crime_dashboard import (bitmaps, countries, frozen, layout, partitions,
+                             profiling, regions, sdg_series, store)
+from crime_dashboard.aggregations import AggregationService
+from crime_dashboard.cube import CountCube
+from crime_dashboard.figures import FigureCache
+from crime_dashboard.modes import MODES
+
+# Columns the page filters offer as selectbox options, where a dataset has
+# them, and Country for the Home page's country counts
+OPTION_COLUMNS = ('Year', 'Subregion', 'Category', 'Indicator', 'Group', 'Geo',
+                  'Country')
+
+
+@st.cache_resource
+def load_dataset(name):
+    """Load one dataset from the columnar store (rebuilt when its CSV changes).
+
+    Each page asks only for the datasets it shows, so a dataset is read the
+    first time a page that needs it is visited. The frame is a shared
+    resource rather than a ``cache_data`` copy: nothing is pickled on the way
+    in or out, and the indexes, partitions and cube built from it all
+    reference the one copy. Derived columns are all added here, before the
+    frame is frozen.
+    """
+    with profiling.span('load', name):
+        # Stored sorted already; this only checks unless the CSV was parsed
+        df = layout.sort_frame(store.load_dataset(name))
+        df['TwoRegion'] = regions.two_regions(df['Region'])
+        # Map locations, resolved once per distinct country name
+        df['ISO3'] = countries.iso3_codes(
+            df['Geo' if name == 'sdg_safety' else 'Country'])
+        if name == 'sdg_safety':
+            # SDG regions -> the continents offered by the region filter
+            df['MappedRegion'] = regions.map_categories(df['Region'],
+                                                        regions.SDG_REGIONS)
+            # Indicator flags and violence/crime types per distinct Series label
+            df = df.assign(**sdg_series.classify_series(df))
+        return frozen.freeze(df)
+
+
+@st.cache_resource
+def region_options(mode_key):
+    """Region selectbox option -> region values it covers, for a mode"""
+    mode = MODES[mode_key]
+    if mode.options is not None:
+        return mode.options
+    all_regions = sorted(load_dataset('offences')['Region'].unique().tolist())
+    options = {mode.all_option: None}
+    options.update((region, [region]) for region in all_regions)
+    return options
+
+
+@st.cache_resource
+def load_bitmap_index(name):
+    """Bitmap index and offset table over the filter columns of one dataset"""
+    frame = load_dataset(name)
+    return bitmaps.BitmapIndex(frame, layout=layout.OffsetTable(frame))
+
+
+@st.cache_resource
+def load_region_indexes(mode_key, name):
+    """Bitmap index views of one dataset, one per region option of a mode"""
+    mode = MODES[mode_key]
+    column = (mode.sdg_region_column if name == 'sdg_safety'
+              else mode.region_column)
+    return partitions.region_partitions(load_bitmap_index(name),
+                                        region_options(mode_key), column)
+
+
+@st.cache_resource
+def load_region_partitions(mode_key, name):
+    """Region-filtered rows of one dataset, built once per data load.
+
+    The frames are shared by every session and rerun, so they are frozen.
+    """
+    return {option: frozen.freeze(view.select())
+            for option, view in load_region_indexes(mode_key, name).items()}
+
+
+def region_frame(mode, name, region):
+    """Rows of dataset ``name`` covered by the selected ``region``"""
+    with profiling.span('region_filter', name):
+        return load_region_partitions(mode.key, name)[region]
+
+
+@st.cache_resource
+def load_column_values(mode_key, name):
+    """Sorted distinct option values per region option and option column.
+
+    Built with the region partitions, so the filter selectboxes never scan
+    rows on a rerun. Missing values are left out.
+    """
+    return {
+        option: {column: tuple(sorted(frame[column].dropna().unique().tolist()))
+                 for column in OPTION_COLUMNS if column in frame.columns}
+        for option, frame in load_region_partitions(mode_key, name).items()}
+
+
+def column_values(mode, name, region, column):
+    """Sorted distinct ``column`` values in the ``region`` rows of ``name``"""
+    return load_column_values(mode.key, name)[region][column]
+
+
+def region_index(mode, name, region):
+    """Bitmap index view of dataset ``name`` restricted to ``region``"""
+    return load_region_indexes(mode.key, name)[region]
+
+
+@st.cache_resource
+def load_offences_cube(region_column='Region'):
+    """Offence record counts by region, Subregion, Category, Country and Year"""
+    offences = load_dataset('offences')
+    with profiling.span('load', 'offences_cube'):
+        return CountCube.from_frame(
+            offences, [region_column, 'Subregion', 'Category', 'Country', 'Year'])
+
+
+@st.cache_resource
+def aggregation_service():
+    """Process-wide memo of page aggregate tables (see .stats() for sizing)"""
+    return AggregationService(maxsize=256)
+
+
+@st.cache_resource
+def figure_cache():
+    """Process-wide memo of built chart figures (see .stats() for sizing)"""
+    return FigureCache(maxsize=256)
@@ -0,0 +1,58 @@
+"""Cached Plotly figures shared by every session.
+
+Building a figure through plotly express or ``go.Figure`` plus a long
+``update_layout`` call validates every property and costs more than the
+aggregate behind it. Charts are keyed on a chart id, a content hash of the
+aggregate they plot and any extra spec values, so an identical aggregate
+gets back the already-built figure whichever session or filter produced it.
+"""
+import hashlib
+
+import pandas as pd
+
+from crime_dashboard import profiling
+from crime_dashboard.lru import LRUCache
+
+
+def frame_digest(data):
+    """Content hash of an aggregate DataFrame or Series.
+
+    Covers column names, dtypes, index and row order, so two tables only
+    share a digest when they would plot identically.
+    """
+    if isinstance(data, pd.Series):
+        data = data.to_frame()
+    digest = hashlib.blake2b(digest_size=16)
+    digest.update(repr((list(data.columns),
+                        [str(dtype) for dtype in data.dtypes])).encode())
+    digest.update(pd.util.hash_pandas_object(data, index=True).values.tobytes())
+    return digest.hexdigest()
+
+
+class FigureCache:
+    """Bounded LRU cache of finished Plotly figures"""
+
+    def __init__(self, maxsize=256):
+        self._cache = LRUCache(maxsize)
+
+    def figure(self, chart, data, build, *spec):
+        """Return ``build()`` for ``chart`` over ``data``, building only on a miss.
+
+        ``build`` must only depend on ``data`` and ``spec``. The returned
+        figure is shared and must not be updated after it comes back.
+        """
+        def timed_build():
+            with profiling.span('figure_build', chart):
+                return build()
+
+        with profiling.span('figure', chart):
+            key = (chart, frame_digest(data), spec)
+            return self._cache.get_or_build(key, timed_build)
+
+    def stats(self):
+        """Hit, miss and eviction counters plus the current fill level"""
+        return self._cache.stats()
+
+    def clear(self):
+        """Drop every cached figure and reset the counters"""
+        self._cache.clear()
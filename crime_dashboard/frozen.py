@@ -0,0 +1,89 @@
+"""Read-only frames for the datasets shared by every session.
+
+The base datasets and their region partitions are cached once per process
+and handed to every session as the same objects, so a page that wrote into
+one would change what every other session sees. :func:`freeze` guards them
+two ways: the column buffers are marked read-only, so value writes
+(``.loc``/``.iloc`` assignment, in-place ``fillna`` ...) raise, and the frame
+is wrapped in :class:`FrozenFrame`, which refuses to add, replace or drop
+columns, to rename its index or columns, or to change its ``attrs``. Derived
+columns are therefore computed in ``data.load_dataset`` before the frame is
+frozen.
+
+Anything derived from a frozen frame (a filter, ``take``, ``assign``,
+``copy``, a groupby) is an ordinary, writable ``DataFrame``; column
+selections that share buffers are copied by pandas' copy-on-write before
+they are written to.
+"""
+import copy
+
+import numpy as np
+import pandas as pd
+
+_READ_ONLY = ("This dataset is shared by every session and is read-only; "
+              "work on a copy (e.g. df.assign(...) or df.copy()) instead")
+
+
+class _FrozenAttrs(dict):
+    """``attrs`` of a frozen frame; copies of it are ordinary dicts"""
+
+    def _refuse(self, *args, **kwargs):
+        raise TypeError(_READ_ONLY)
+
+    __setitem__ = __delitem__ = __ior__ = _refuse
+    clear = pop = popitem = setdefault = update = _refuse
+
+    def __copy__(self):
+        return dict(self)
+
+    def __deepcopy__(self, memo):
+        return copy.deepcopy(dict(self), memo)
+
+
+class FrozenFrame(pd.DataFrame):
+    """DataFrame whose columns, axis names and ``attrs`` cannot be changed"""
+
+    @property
+    def _constructor(self):
+        # Results of operations on a frozen frame are ordinary frames
+        return pd.DataFrame
+
+    def _refuse(self, *args, **kwargs):
+        raise TypeError(_READ_ONLY)
+
+    __setitem__ = __delitem__ = insert = pop = _update_inplace = _refuse
+
+    def __setattr__(self, name, value):
+        if name in ('columns', 'index', 'attrs'):
+            self._refuse()
+        super().__setattr__(name, value)
+
+
+def _buffers(values):
+    """NumPy arrays holding a column's values (codes and masks included)"""
+    if isinstance(values, np.ndarray):
+        yield values
+        return
+    # Categorical/datetime arrays keep an ``_ndarray``; nullable integer and
+    # boolean arrays a ``_data`` and ``_mask``. Arrow-backed columns have no
+    # NumPy buffer to lock; the schema stores text as categoricals instead.
+    for attr in ('_ndarray', '_data', '_mask'):
+        buffer = getattr(values, attr, None)
+        if isinstance(buffer, np.ndarray):
+            yield buffer
+
+
+def freeze(df):
+    """Read-only :class:`FrozenFrame` over the same buffers as ``df``"""
+    if isinstance(df, FrozenFrame):
+        return df
+    frozen = FrozenFrame(df)
+    # The frame has axis objects of its own; pandas refuses to rename an
+    # index flagged like this (as it does MultiIndex levels)
+    frozen.index._no_setting_name = True
+    frozen.columns._no_setting_name = True
+    object.__setattr__(frozen, '_attrs', _FrozenAttrs(df.attrs))
+    for block in frozen._mgr.blocks:
+        for buffer in _buffers(block.values):
+            buffer.flags.writeable = False
+    return frozen
@@ -0,0 +1,73 @@
+"""Sort-once row layout of a dataset and its offset table.
+
+Datasets are stored sorted by (Region, Subregion, Year, Category), the
+hierarchy the region filter and the Overview, Conviction and Justice page
+filters follow. Each row's position in that order is summed up by an integer
+key built from the columns' factorized codes; the :class:`OffsetTable` keeps
+only the distinct keys and the row at which each run starts. The rows of a
+region, a region and subregion, or a region, subregion and year are then one
+contiguous range found with two ``searchsorted`` calls on that small table,
+without reading the columns themselves.
+"""
+import numpy as np
+import pandas as pd
+
+SORT_COLUMNS = ('Region', 'Subregion', 'Year', 'Category')
+
+
+def _key(frame, columns):
+    """Per-row sort key over ``columns`` and the sorted values of each column"""
+    key = np.zeros(len(frame), dtype=np.int64)
+    levels = []
+    for column in columns:
+        codes, uniques = pd.factorize(frame[column], sort=True)
+        # Missing values get code 0, so they sort first within their parent
+        key = key * (len(uniques) + 1) + (codes + 1)
+        levels.append(pd.Index(uniques))
+    return key, levels
+
+
+def sort_frame(df, columns=SORT_COLUMNS):
+    """``df`` stably sorted by those of ``columns`` it has (as-is if it already is)"""
+    columns = [column for column in columns if column in df.columns]
+    key, _ = _key(df, columns)
+    if (key[1:] >= key[:-1]).all():
+        return df
+    return df.take(np.argsort(key, kind='stable')).reset_index(drop=True)
+
+
+class OffsetTable:
+    """Row ranges of the runs of a frame sorted with :func:`sort_frame`"""
+
+    def __init__(self, frame, columns=SORT_COLUMNS):
+        self.columns = [column for column in columns if column in frame.columns]
+        key, self.levels = _key(frame, self.columns)
+        if not (key[1:] >= key[:-1]).all():
+            raise ValueError("frame is not sorted by "
+                             f"{', '.join(self.columns)}; use sort_frame")
+        self.keys, starts = np.unique(key, return_index=True)
+        # Run i holds rows offsets[i]:offsets[i + 1]
+        self.offsets = np.append(starts, len(frame))
+        # Keys per value of each column, for turning a prefix into a key range
+        self._scales = [int(np.prod([len(level) + 1
+                                     for level in self.levels[i + 1:]]))
+                        for i in range(len(self.levels))]
+
+    def span(self, *values):
+        """Rows ``(start, stop)`` holding ``values`` of the leading columns"""
+        prefix = 0
+        for level, value in zip(self.levels, values):
+            try:
+                code = level.get_loc(value)
+            except KeyError:
+                return 0, 0
+            prefix = prefix * (len(level) + 1) + code + 1
+        scale = self._scales[len(values) - 1] if values else (
+            self._scales[0] * (len(self.levels[0]) + 1))
+        first, last = np.searchsorted(
+            self.keys, [prefix * scale, (prefix + 1) * scale])
+        return int(self.offsets[first]), int(self.offsets[last])
+
+    def values(self, column):
+        """Sorted distinct values of a layout column"""
+        return list(self.levels[self.columns.index(column)])
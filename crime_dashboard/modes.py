@@ -0,0 +1,73 @@
+"""Region modes the dashboard entry scripts run in.
+
+Every entry script renders the same pages; they differ only in which
+regions the global filter offers, which column it filters on and the copy
+around the charts. A mode bundles those choices so ``app.run(mode)`` is the
+whole of an entry script.
+"""
+from crime_dashboard import narrative
+
+
+class RegionMode:
+    """Region filter options, filter columns and copy for one entry script"""
+
+    def __init__(self, key, page_title, title, subtitle, region_label,
+                 options, all_option=None, region_column='Region',
+                 sdg_region_column='MappedRegion', text=narrative.REGIONAL):
+        self.key = key
+        self.page_title = page_title
+        self.title = title
+        self.subtitle = subtitle
+        self.region_label = region_label
+        # Selectbox option -> region values it covers (None keeps every row).
+        # None means one option per Region found in the offences data.
+        self.options = options
+        self.all_option = all_option
+        self.region_column = region_column
+        self.sdg_region_column = sdg_region_column
+        self.text = text
+
+    def display_name(self, region):
+        """How the selected region is named in page copy"""
+        return 'Worldwide' if region == self.all_option else region
+
+
+ASIA_AMERICAS = RegionMode(
+    'asia_americas',
+    page_title="Crime Statistics Dashboard: Asia & Americas",
+    title="Sexual Crime Statistics Dashboard: Asia & Americas",
+    subtitle="Comprehensive analysis of crime data trends and patterns across two major world regions",
+    region_label="🌍 Select Region",
+    options={
+        'Asia': ['Asia'],
+        'Americas': ['Americas'],
+        'Both America vs Asia': ['Americas', 'Asia'],
+    })
+
+# Every region folded into Americas or Asia with regions.to_two_region
+TWO_REGION = RegionMode(
+    'two_region',
+    page_title="Global Sexual Crime Statistics Dashboard",
+    title="Global Sexual Crime Statistics Dashboard",
+    subtitle="Comprehensive analysis of crime data trends and patterns worldwide",
+    region_label="🌍 Region",
+    options={
+        "Both (Americas vs Asia)": ["Americas", "Asia"],
+        "Americas": ["Americas"],
+        "Asia": ["Asia"],
+    },
+    region_column='TwoRegion',
+    sdg_region_column='TwoRegion',
+    text=narrative.GLOBAL)
+
+WORLDWIDE = RegionMode(
+    'worldwide',
+    page_title="Global Crime Statistics Dashboard",
+    title="Global Crime Statistics Dashboard",
+    subtitle="Comprehensive analysis of crime data trends and patterns worldwide",
+    region_label="🌍 Select Region",
+    options=None,
+    all_option='All Regions',
+    text=narrative.GLOBAL)
+
+MODES = {mode.key: mode for mode in (ASIA_AMERICAS, TWO_REGION, WORLDWIDE)}
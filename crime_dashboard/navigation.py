@@ -0,0 +1,15 @@
+"""Page switching for the navigation row and the Home page cards.
+
+Buttons switch pages through an ``on_click`` callback. Streamlit runs the
+callback before the rerun the click triggers, so that rerun already renders
+the new page. Setting the page after the button returns ``True`` would need
+a second ``st.rerun()``.
+"""
+import streamlit as st
+
+HOME = "🏠 Home"
+
+
+def go_to(page):
+    """Button callback: make ``page`` the current page"""
+    st.session_state.current_page = page
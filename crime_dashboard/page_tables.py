@@ -0,0 +1,232 @@
+"""Aggregate tables behind each dashboard page.
+
+Each builder takes a :class:`crime_dashboard.bitmaps.BitmapIndex` view of
+one dataset restricted to the selected region, plus the page's filter
+values (``None`` meaning "all"), and returns a dict with the stat card
+values and every chart table the page draws. The filter values are resolved
+against the view's bitmaps, so only the matching rows are ever copied. Builders are pure so their
+results can be memoized by :class:`crime_dashboard.aggregations.AggregationService`.
+
+Stat card values are read off the grouped tables the charts use (or one
+``agg``/``nunique`` call) rather than by scanning the rows once per card.
+"""
+from crime_dashboard import profiling
+from crime_dashboard.sdg_series import flag_values, has_flag
+
+
+def _counts(df, by, name='count'):
+    with profiling.span('groupby', by):
+        return df.groupby(by, observed=True).size().reset_index(name=name)
+
+
+def _sums(df, by):
+    with profiling.span('groupby', by):
+        return df.groupby(by, observed=True)['VALUE'].sum().reset_index()
+
+
+def _map_counts(df, name):
+    """Row counts per ISO3 code, named after the countries that share it"""
+    counts = _counts(df, ['ISO3', 'Country'], name)
+    return counts.groupby('ISO3', observed=True).agg(
+        Country=('Country', lambda names: ', '.join(map(str, names))),
+        **{name: (name, 'sum')}).reset_index()
+
+
+def _count_of(counts, column, value, name='count'):
+    """Count for ``value`` in a ``_counts`` table, 0 when it has no rows"""
+    matches = counts.loc[counts[column] == value, name]
+    return int(matches.iloc[0]) if len(matches) else 0
+
+
+def gender_tables(victims, year=None, category=None):
+    """Victim tables for the Gender page"""
+    victims = victims.select(Year=year, Category=category)
+
+    sex_counts = _counts(victims, 'Sex')
+    # Sort to ensure consistent ordering: Female first, Male second
+    sex_counts = sex_counts.sort_values('Sex')
+
+    return {
+        'male_victims': _count_of(sex_counts, 'Sex', 'Male'),
+        'female_victims': _count_of(sex_counts, 'Sex', 'Female'),
+        'total_victims': len(victims),
+        'countries': sorted(victims['Country'].unique()),
+        'sex_counts': sex_counts,
+        'relationship_counts': _counts(victims, 'Category'),
+        'gender_category': _counts(victims, ['Category', 'Sex']),
+    }
+
+
+def trafficking_tables(trafficking, year=None, indicator=None):
+    """Trafficking tables for the Trafficking page"""
+    trafficking = trafficking.select(Year=year, Indicator=indicator)
+    indicator_counts = _counts(trafficking, 'Indicator')
+    country_counts = _counts(trafficking, 'Country')
+    dimension_counts = _counts(trafficking, 'Dimension')
+
+    return {
+        'detected_victims': _count_of(indicator_counts, 'Indicator',
+                                      'Detected trafficking victims'),
+        'offences_count': _count_of(indicator_counts, 'Indicator',
+                                    'Offences of trafficking in persons'),
+        'countries_affected': len(country_counts),
+        'dimensions': len(dimension_counts),
+        'indicator_counts': indicator_counts,
+        'country_counts': country_counts.sort_values(
+            'count', ascending=False).head(10),
+        'dimension_counts': dimension_counts.sort_values(
+            'count', ascending=True).tail(10),
+        'subregion_counts': _counts(trafficking, 'Subregion').sort_values(
+            'count', ascending=False).head(10),
+    }
+
+
+def conviction_tables(convicted, year=None, category=None, subregion=None):
+    """Conviction tables for the Conviction page"""
+    convicted = convicted.select(Year=year, Category=category,
+                                 Subregion=subregion)
+    has_values = 'VALUE' in convicted.columns
+    tables = {
+        'has_values': has_values,
+        'total_convictions': 0,
+        'countries': convicted['Country'].nunique(),
+        'avg_convictions': 0,
+        'max_convictions': 0,
+    }
+    if has_values:
+        if len(convicted) > 0:
+            values = convicted['VALUE'].agg(['sum', 'mean', 'max'])
+            tables.update(total_convictions=int(values['sum']),
+                          avg_convictions=int(values['mean']),
+                          max_convictions=int(values['max']))
+        tables.update(
+            category_yearly=_sums(convicted, ['Year', 'Category']),
+            country_conv=_sums(convicted, 'Country').sort_values(
+                'VALUE', ascending=False).head(10),
+            subregion_conv=_sums(convicted, 'Subregion').sort_values(
+                'VALUE', ascending=True).tail(10),
+            category_breakdown=_sums(convicted, 'Category'),
+        )
+    return tables
+
+
+def prosecution_tables(prosecuted, year=None, category=None, subregion=None):
+    """Prosecution tables for the Justice page"""
+    prosecuted = prosecuted.select(Year=year, Category=category,
+                                   Subregion=subregion)
+    # One Country groupby serves the card and the top-10 chart
+    country_counts = _counts(prosecuted, 'Country')
+    return {
+        'records': len(prosecuted),
+        'countries': len(country_counts),
+        'category_yearly': _counts(prosecuted, ['Year', 'Category']),
+        'country_counts': country_counts.sort_values(
+            'count', ascending=False).head(10),
+        'subregion_counts': _counts(prosecuted, 'Subregion').sort_values(
+            'count', ascending=False).head(10),
+        'country_map': _map_counts(prosecuted, 'Prosecution Records'),
+    }
+
+
+def personnel_tables(personnel, group=None):
+    """Personnel tables for the Justice page"""
+    personnel = personnel.select(Group=group)
+    return {
+        'records': len(personnel),
+        'countries': personnel['Country'].nunique(),
+        'group_counts': _counts(personnel, 'Group').sort_values(
+            'count', ascending=True),
+    }
+
+
+def _homicide_tables(data):
+    return {
+        'yearly_gender': _counts(data, ['Year', 'Sex'], 'Records'),
+        'country_counts': _counts(data, 'Geo', 'Records').sort_values(
+            'Records', ascending=False).head(10),
+        'regional_data': _counts(data, 'Region', 'Records').sort_values(
+            'Records', ascending=True),
+    }
+
+
+def _trafficking_tables(data):
+    return {
+        'yearly_data': _counts(data, 'Year', 'Records'),
+        'gender_data': _counts(data, 'Sex', 'Records'),
+        'country_data': _counts(data, 'Geo', 'Records').sort_values(
+            'Records', ascending=False).head(15),
+    }
+
+
+def _safety_tables(data):
+    return {
+        'yearly_data': _counts(data, 'Year', 'Records'),
+        'gender_data': _counts(data, 'Sex', 'Records'),
+        'country_data': _counts(data, 'Geo', 'Records').sort_values(
+            'Records', ascending=True).tail(15),
+    }
+
+
+def _violence_tables(data):
+    return {
+        'type_data': _counts(data, 'ViolenceType', 'Records').sort_values(
+            'Records', ascending=True),
+        'yearly_type': _counts(data, ['Year', 'ViolenceType'], 'Records'),
+        'gender_type': _counts(data, ['ViolenceType', 'Sex'], 'Records'),
+    }
+
+
+def _police_tables(data):
+    return {
+        'crime_data': _counts(data, 'CrimeType', 'Records').sort_values(
+            'Records', ascending=False),
+        'gender_crime': _counts(data, ['CrimeType', 'Sex'], 'Records'),
+        'yearly_crime': _counts(data, ['Year', 'CrimeType'], 'Records'),
+    }
+
+
+def _prison_tables(data):
+    prison = data[has_flag(data, 'unsentenced')]
+    bribery = data[has_flag(data, 'bribery')]
+    return {
+        'yearly_prison': _counts(prison, 'Year', 'Records'),
+        'yearly_bribery': _counts(bribery, 'Year', 'Records'),
+        'regional_data': _counts(data, 'Region', 'Records').sort_values(
+            'Records', ascending=True),
+    }
+
+
+_SDG_INDICATOR_TABLES = {
+    '📊 Intentional Homicide': _homicide_tables,
+    '🚨 Human Trafficking': _trafficking_tables,
+    '🌃 Safety Perception': _safety_tables,
+    '⚠️ Violence Prevalence': _violence_tables,
+    '👮 Police Reporting': _police_tables,
+    '⚖️ Prison & Bribery': _prison_tables,
+}
+
+
+def sdg_tables(sdg, indicator, year_range, sex=None, country=None,
+               subregion=None):
+    """SDG tables for the selected indicator on the Safety & SDG page.
+
+    ``sdg`` must index a frame carrying the
+    :func:`crime_dashboard.sdg_series.classify_series` columns.
+    """
+    years = [year for year in sdg.values('Year')
+             if year_range[0] <= year <= year_range[1]]
+    # Every filter, the indicator's Series included, resolves to bitmaps
+    data = sdg.select(SeriesFlags=flag_values(sdg.values('SeriesFlags'),
+                                              indicator),
+                      Year=years, Sex=sex, Geo=country, Subregion=subregion)
+
+    distinct = data[['Year', 'Geo', 'Series']].nunique()
+    tables = {
+        'records': len(data),
+        'years': int(distinct['Year']),
+        'countries': int(distinct['Geo']),
+        'series': int(distinct['Series']),
+    }
+    if len(data) > 0:
+        tables.update(_SDG_INDICATOR_TABLES[indicator](data))
+    return tables
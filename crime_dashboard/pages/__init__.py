@@ -0,0 +1,17 @@
+"""Dashboard pages, one module per navigation tab.
+
+Each module exposes ``render(mode, selected_region)``; ``PAGES`` maps the
+``st.session_state.current_page`` titles to them.
+"""
+from crime_dashboard.pages import (conviction, gender, home, justice,
+                                   overview, sdg, trafficking)
+
+PAGES = {
+    "🏠 Home": home.render,
+    "📈 Overview": overview.render,
+    "👥 Gender Analysis": gender.render,
+    "🔍 Trafficking Analysis": trafficking.render,
+    "⚖️ Conviction Outcomes": conviction.render,
+    "🏛️ Justice System Capacity": justice.render,
+    "🛡️ Safety & SDG Indicators": sdg.render,
+}
@@ -0,0 +1,241 @@
+"""Conviction Outcomes page: convictions by category, country and subregion."""
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from crime_dashboard import data, page_tables, profiling, templates
+
+
+def render(mode, selected_region):
+    """Render the Conviction Outcomes page for ``selected_region``"""
+    st.markdown(templates.intro_box(
+        "⚖️ Conviction Outcomes: Justice System Results",
+        "Quantitative analysis of actual conviction counts for serious crimes (rape and drug trafficking). Unlike other tabs showing reporting coverage, these metrics represent real judicial outcomes with verified conviction numbers."),
+                unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3)
+    with col1:
+        conviction_years = ['All Years', *data.column_values(
+            mode, 'convicted', selected_region, 'Year')]
+        selected_year_conviction = st.selectbox(
+            "Year",
+            conviction_years,
+            key="year_conviction")
+    with col2:
+        crime_categories = ['All Categories', *data.column_values(
+            mode, 'convicted', selected_region, 'Category')]
+        selected_crime_cat = st.selectbox("Crime Category",
+                                          crime_categories,
+                                          key="crime_cat")
+    with col3:
+        subregions_conv = ['All Subregions', *data.column_values(
+            mode, 'convicted', selected_region, 'Subregion')]
+        selected_subregion_conv = st.selectbox("Subregion",
+                                               subregions_conv,
+                                               key="subregion_conv")
+
+    # Conviction tables for this region and filter combination
+    conviction = data.aggregation_service().tables(
+        page_tables.conviction_tables, 'convicted', (mode.key, selected_region),
+        data.region_index(mode, 'convicted', selected_region),
+        year=None if selected_year_conviction == 'All Years' else selected_year_conviction,
+        category=None if selected_crime_cat == 'All Categories' else selected_crime_cat,
+        subregion=None if selected_subregion_conv == 'All Subregions' else selected_subregion_conv)
+
+    # Statistics
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    total_convictions = conviction['total_convictions']
+    countries_conv = conviction['countries']
+    year_display = selected_year_conviction if selected_year_conviction != 'All Years' else 'All Years'
+
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{total_convictions:,}</div>
+            <div class="stat-label">Total Convictions</div>
+            <div class="stat-change negative">{year_display}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{countries_conv}</div>
+            <div class="stat-label">Countries Reporting</div>
+            <div class="stat-change negative">With conviction data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        avg_convictions = conviction['avg_convictions']
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{avg_convictions}</div>
+            <div class="stat-label">Average per Record</div>
+            <div class="stat-change negative">Mean convictions</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        max_convictions = conviction['max_convictions']
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{max_convictions:,}</div>
+            <div class="stat-label">Highest Single Record</div>
+            <div class="stat-change negative">Maximum value</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    # Add spacing between stats and charts
+    st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+
+    # Charts in connected white containers
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Convictions by Crime Category Over Time",
+            "Compares conviction trends between rape and drug trafficking cases across years. This reveals how judicial efforts against these serious crimes have evolved and identifies which crime type sees more successful prosecutions.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if conviction['has_values']:
+            category_yearly = conviction['category_yearly']
+
+            def build_fig():
+                fig = px.bar(category_yearly,
+                             x='Year',
+                             y='VALUE',
+                             color='Category',
+                             barmode='group',
+                             color_discrete_map={
+                                 'Rape': '#667eea',
+                                 'Drug trafficking': '#ec4899'
+                             })
+                fig.update_layout(height=300,
+                                  margin=dict(l=40, r=20, t=10, b=100),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', 
+                                            tickfont=dict(color='#2d3748'),
+                                            title=dict(text='Year', font=dict(color='#2d3748'))),
+                                  yaxis=dict(gridcolor='#cbd5e0', 
+                                            tickfont=dict(color='#2d3748'),
+                                            title=dict(text='Total Convictions', font=dict(color='#2d3748'))),
+                                  legend=dict(
+                                      orientation='h',
+                                      yanchor='top',
+                                      y=-0.35,
+                                      xanchor='center',
+                                      x=0.5,
+                                      font=dict(color='#2d3748', size=8),
+                                      title=dict(text='Crime Type', font=dict(color='#2d3748', size=8))))
+                return fig
+
+            fig = data.figure_cache().figure('conviction/category_yearly', category_yearly, build_fig)
+            profiling.plotly_chart(fig, 'conviction/category_yearly', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Top 10 Countries by Convictions",
+            "Ranks countries by total conviction counts, showing which nations have the highest judicial activity for serious crimes. Higher conviction numbers indicate both active enforcement and robust criminal justice systems.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if conviction['has_values']:
+            country_conv = conviction['country_conv']
+
+            def build_fig():
+                fig = go.Figure()
+                fig.add_trace(
+                    go.Bar(y=country_conv['Country'],
+                           x=country_conv['VALUE'],
+                           orientation='h',
+                           marker=dict(color='#764ba2')))
+                fig.update_layout(height=300,
+                                  margin=dict(l=150, r=20, t=10, b=40),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                                  yaxis=dict(tickfont=dict(color='#2d3748')),
+                                  showlegend=False)
+                return fig
+
+            fig = data.figure_cache().figure('conviction/countries', country_conv, build_fig)
+            profiling.plotly_chart(fig, 'conviction/countries', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Second row of charts
+    col1, col2 = st.columns(2, gap="small")
+    
+    with col1:
+        st.markdown(templates.chart_card(
+            "Regional Conviction Distribution",
+            "Shows the geographic distribution of convictions across world subregions. This highlights where judicial systems are most actively prosecuting these crimes and where enforcement may be stronger or better documented.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if conviction['has_values']:
+            subregion_conv = conviction['subregion_conv']
+
+            def build_fig():
+                fig = go.Figure()
+                fig.add_trace(
+                    go.Bar(y=subregion_conv['Subregion'],
+                           x=subregion_conv['VALUE'],
+                           orientation='h',
+                           marker=dict(color='#06b6d4')))
+                fig.update_layout(height=300,
+                                  margin=dict(l=150, r=20, t=10, b=40),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                                  yaxis=dict(tickfont=dict(color='#2d3748')),
+                                  showlegend=False)
+                return fig
+
+            fig = data.figure_cache().figure('conviction/subregions', subregion_conv, build_fig)
+            profiling.plotly_chart(fig, 'conviction/subregions', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(templates.chart_card(
+            "Category Breakdown",
+            "Displays the proportion of convictions between rape and drug trafficking cases. This pie chart reveals which crime category receives more judicial attention and successful prosecution outcomes in the selected timeframe.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if conviction['has_values']:
+            category_breakdown = conviction['category_breakdown']
+
+            def build_fig():
+                fig = px.pie(category_breakdown,
+                             values='VALUE',
+                             names='Category',
+                             color_discrete_map={
+                                 'Rape': '#667eea',
+                                 'Drug trafficking': '#ec4899'
+                             })
+                fig.update_traces(textfont=dict(color='#2d3748', size=12))
+                fig.update_layout(height=300,
+                                  margin=dict(l=20, r=20, t=10, b=60),
+                                  paper_bgcolor='white',
+                                  font=dict(color='#2d3748', size=11),
+                                  legend=dict(
+                                      orientation='h',
+                                      yanchor='top',
+                                      y=-0.15,
+                                      xanchor='center',
+                                      x=0.5,
+                                      font=dict(color='#2d3748', size=8)))
+                return fig
+
+            fig = data.figure_cache().figure('conviction/categories', category_breakdown, build_fig)
+            profiling.plotly_chart(fig, 'conviction/categories', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,218 @@
+"""Gender Analysis page: victim counts by sex and perpetrator relationship."""
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from crime_dashboard import data, page_tables, profiling, templates
+
+
+def render(mode, selected_region):
+    """Render the Gender Analysis page for ``selected_region``"""
+    st.markdown(templates.intro_box(
+        "👥 Gender-Disaggregated Data Coverage",
+        "Availability of gender-disaggregated victimization data, showing which countries report victim demographics by sex and perpetrator relationship."),
+                unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        years_victims = ['All Years', *data.column_values(
+            mode, 'victims', selected_region, 'Year')]
+        selected_year_gender = st.selectbox(
+            "Year",
+            years_victims,
+            key="year_gender")
+    with col2:
+        categories_victims = ['All', *data.column_values(
+            mode, 'victims', selected_region, 'Category')]
+        selected_category_gender = st.selectbox("Relationship Category",
+                                                categories_victims,
+                                                key="category_gender")
+
+    # Victim tables for this region and filter combination
+    gender = data.aggregation_service().tables(
+        page_tables.gender_tables, 'victims', (mode.key, selected_region),
+        data.region_index(mode, 'victims', selected_region),
+        year=None if selected_year_gender == 'All Years' else selected_year_gender,
+        category=None if selected_category_gender == 'All' else selected_category_gender)
+
+    # Gender statistics
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    male_victims = gender['male_victims']
+    female_victims = gender['female_victims']
+    total_victims_count = gender['total_victims']
+    countries_reporting_victims = len(gender['countries'])
+
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{male_victims:,}</div>
+            <div class="stat-label">Male Victim Records</div>
+            <div class="stat-change negative">Data records</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{female_victims:,}</div>
+            <div class="stat-label">Female Victim Records</div>
+            <div class="stat-change negative">Data records</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{total_victims_count:,}</div>
+            <div class="stat-label">Total Records</div>
+            <div class="stat-change negative">{selected_year_gender}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{countries_reporting_victims}</div>
+            <div class="stat-label">Reporting Countries</div>
+            <div class="stat-change negative">{selected_year_gender}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    # Add spacing
+    st.markdown("<div style='margin-top: 20px;'></div>", unsafe_allow_html=True)
+    
+    # Countries list section
+    reporting_countries = gender['countries']
+    countries_badges = ''.join([f'<span style="display: inline-block; background: #f3f4f6; color: #374151; padding: 6px 12px; margin: 4px; border-radius: 6px; font-size: 0.85rem; font-weight: 500;">{country}</span>' for country in reporting_countries])
+    
+    st.markdown(f"""
+    <div style="background: white; border-radius: 12px; padding: 20px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin-bottom: 20px;">
+        <h4 style="color: #000000; font-size: 1rem; font-weight: 600; margin: 0 0 12px 0;">Countries Reporting Gender-Disaggregated Victim Data</h4>
+        <div style="max-height: 150px; overflow-y: auto; padding: 5px;">
+            {countries_badges}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+    
+    # Add spacing between countries and charts
+    st.markdown("<div style='margin-top: 10px;'></div>", unsafe_allow_html=True)
+
+    # Charts in one connected container
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Victims by Sex",
+            "Shows the gender breakdown of reported crime victims. This visualization displays the proportion of male and female victims in the database, helping identify gender-specific patterns in victimization.",
+            variant='ink'), unsafe_allow_html=True)
+
+        sex_counts = gender['sex_counts']
+
+        # Create color list: Pink for Female, Cyan for Male
+        colors = []
+        for sex in sex_counts['Sex']:
+            if sex == 'Female':
+                colors.append('#ec4899')  # Pink
+            else:
+                colors.append('#06b6d4')  # Cyan
+        
+        def build_fig():
+            fig = px.pie(sex_counts,
+                         values='count',
+                         names='Sex')
+            fig.update_traces(marker=dict(colors=colors),
+                             textfont=dict(color='#2d3748', size=11))
+            fig.update_layout(height=300, 
+                              margin=dict(l=5, r=5, t=0, b=60),
+                              paper_bgcolor='white',
+                              font=dict(color='#2d3748', size=10),
+                              legend=dict(
+                                  orientation='h',
+                                  yanchor='top',
+                                  y=-0.15,
+                                  xanchor='center',
+                                  x=0.5,
+                                  font=dict(color='#2d3748', size=8)))
+            return fig
+
+        fig = data.figure_cache().figure('gender/sex_split', sex_counts, build_fig)
+        profiling.plotly_chart(fig, 'gender/sex_split', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Relationship to Perpetrator",
+            "Displays the relationship categories between victims and perpetrators. This chart reveals whether crimes involve intimate partners, family members, or other known/unknown individuals.",
+            variant='ink'), unsafe_allow_html=True)
+
+        relationship_counts = gender['relationship_counts']
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(x=relationship_counts['Category'],
+                       y=relationship_counts['count'],
+                       marker=dict(color='#667eea')))
+            fig.update_layout(height=300,
+                              margin=dict(l=40, r=20, t=10, b=60),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748'), tickangle=-45),
+                              yaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('gender/relationships', relationship_counts, build_fig)
+        profiling.plotly_chart(fig, 'gender/relationships', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Gender comparison across relationship categories - more insightful analysis
+    st.markdown(templates.chart_card(
+        "Gender Patterns Across Perpetrator Relationships",
+        "Compares male and female victimization patterns across different perpetrator relationship categories. This reveals which types of relationships show the strongest gender disparities in crime victimization.",
+        variant='ink'), unsafe_allow_html=True)
+
+    # Group by category and sex to see gender patterns across relationship types
+    gender_category = gender['gender_category']
+
+    def build_fig():
+        fig = px.bar(gender_category,
+                     x='Category',
+                     y='count',
+                     color='Sex',
+                     barmode='group',
+                     color_discrete_map={
+                         'Male': '#06b6d4',
+                         'Female': '#ec4899'
+                     })
+        fig.update_layout(height=300,
+                          margin=dict(l=40, r=20, t=10, b=120),
+                          plot_bgcolor='white',
+                          paper_bgcolor='white',
+                          xaxis=dict(gridcolor='#cbd5e0', 
+                                    tickfont=dict(color='#2d3748'),
+                                    tickangle=-45,
+                                    title=dict(text='Perpetrator Relationship', font=dict(color='#2d3748'))),
+                          yaxis=dict(gridcolor='#cbd5e0', 
+                                    tickfont=dict(color='#2d3748'),
+                                    title=dict(text='Number of Records', font=dict(color='#2d3748'))),
+                          legend=dict(
+                              orientation='h',
+                              yanchor='top',
+                              y=-0.45,
+                              xanchor='center',
+                              x=0.5,
+                              font=dict(color='#2d3748', size=8),
+                              title=dict(text='Gender', font=dict(color='#2d3748', size=8))))
+        return fig
+
+    fig = data.figure_cache().figure('gender/by_category', gender_category, build_fig)
+    profiling.plotly_chart(fig, 'gender/by_category', use_container_width=True)
+    st.markdown('</div>', unsafe_allow_html=True)
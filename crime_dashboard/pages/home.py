@@ -0,0 +1,199 @@
+"""Home page: coverage narrative, headline statistics and page cards."""
+import streamlit as st
+
+from crime_dashboard import data, navigation
+
+
+def render(mode, selected_region):
+    """Render the Home page for ``selected_region``"""
+    filtered_convicted = data.region_frame(mode, 'convicted', selected_region)
+    trafficking_index = data.region_index(mode, 'trafficking', selected_region)
+
+    # Display selected region
+    region_display = mode.display_name(selected_region)
+
+    # Calculate key statistics from real data
+    total_countries = len(data.column_values(
+        mode, 'offences', selected_region, 'Country'))
+    total_convicted = int(filtered_convicted['VALUE'].sum()
+                          ) if 'VALUE' in filtered_convicted.columns and len(
+                              filtered_convicted) > 0 else 0
+    total_trafficking_victims = trafficking_index.count(
+        Indicator='Detected trafficking victims')
+
+    st.markdown(f"""
+    <div class="hero-section">
+        <h2 class="hero-title">Crime Data Reporting Coverage - {region_display}</h2>
+        <div style="text-align: left; max-width: 1000px; margin: 30px auto 0 auto; padding: 0 20px;">
+{mode.text['story']}
+        </div>
+    </div>
+    """, unsafe_allow_html=True)
+
+    col1, col2, col3 = st.columns(3, gap="large")
+    with col1:
+        st.markdown(f"""
+        <div class="hero-stat">
+            <div class="hero-stat-number">{total_trafficking_victims:,}</div>
+            <div class="hero-stat-label">Trafficking Data Records</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    with col2:
+        st.markdown(f"""
+        <div class="hero-stat">
+            <div class="hero-stat-number">{total_countries}</div>
+            <div class="hero-stat-label">Countries Reporting</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    with col3:
+        st.markdown(f"""
+        <div class="hero-stat">
+            <div class="hero-stat-number">{total_convicted:,}</div>
+            <div class="hero-stat-label">Total Convictions</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    st.markdown("<br>", unsafe_allow_html=True)
+
+    # Feature cards with navigation
+    col1, col2 = st.columns(2, gap="large")
+    with col1:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">📈</div>
+            <h3 class="feature-title">Data Coverage Overview</h3>
+            <p class="feature-description">Hypothesis: Crime data reporting patterns vary significantly across countries and regions, revealing temporal consistency gaps and geographic disparities in crime intelligence infrastructure. Analyzes which countries maintain continuous multi-year reporting versus sporadic participation, and identifies regional clusters with strong versus weak data submission practices that may reflect underlying statistical capacity differences.</p>
+            <div class="feature-highlight">Multi-year coverage trends</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("📈", key="overview_card", use_container_width=True, help="Click to view Overview",
+                  on_click=navigation.go_to, args=("📈 Overview",))
+    with col2:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">👥</div>
+            <h3 class="feature-title">Gender Data Patterns</h3>
+            <p class="feature-description">Hypothesis: Gender-disaggregated crime data availability varies across countries and crime types, with some jurisdictions providing detailed sex-specific victimization statistics while others report aggregated totals. Analyzes perpetrator-victim relationship patterns (intimate partner, known person, stranger) by gender to identify reporting trends, and examines whether certain relationship categories show gender-skewed data submission patterns.</p>
+            <div class="feature-highlight">Demographic reporting</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("👥", key="gender_card", use_container_width=True, help="Click to view Gender Analysis",
+                  on_click=navigation.go_to, args=("👥 Gender Analysis",))
+
+    col1, col2 = st.columns(2, gap="large")
+    with col1:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">🔍</div>
+            <h3 class="feature-title">Trafficking Data Coverage</h3>
+            <p class="feature-description">Hypothesis: Trafficking detection and reporting patterns vary substantially across countries and regions, with some jurisdictions demonstrating consistent data submission on detected victims while others show gaps. Analyzes cross-border trafficking flows through country of repatriation and citizenship data, examines exploitation type distributions (sexual exploitation versus forced labour), and tracks whether detection efforts correlate with prosecution and conviction reporting to assess criminal justice system follow-through.</p>
+            <div class="feature-highlight">Detection reporting</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("🔍", key="trafficking_card", use_container_width=True, help="Click to view Trafficking Analysis",
+                  on_click=navigation.go_to, args=("🔍 Trafficking Analysis",))
+    with col2:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">⚠️</div>
+            <h3 class="feature-title">Conviction Statistics</h3>
+            <p class="feature-description">Hypothesis: Conviction outcomes for rape and drug trafficking crimes serve as measurable indicators of criminal justice system accountability, where temporal trends and prosecution-to-conviction ratios reveal whether reported cases translate into judicial outcomes. Analyzes geographic variations in conviction reporting, identifies countries with consistent conviction data versus sporadic records, and examines whether regions with higher prosecution volumes demonstrate proportional conviction rates or system bottlenecks.</p>
+            <div class="feature-highlight">Quantitative data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("⚖️", key="conviction_card", use_container_width=True, help="Click to view Conviction Outcomes",
+                  on_click=navigation.go_to, args=("⚖️ Conviction Outcomes",))
+
+    col1, col2 = st.columns(2, gap="large")
+    with col1:
+        st.markdown("""
+        <div class="feature-card">
+            <div class="feature-icon">🏛️</div>
+            <h3 class="feature-title">Justice System Reporting</h3>
+            <p class="feature-description">Hypothesis: Criminal justice personnel reporting varies by country and system component, with some jurisdictions providing comprehensive data on police, judicial, and prison personnel while others submit partial records. Analyzes which personnel categories (prevention police, judges, prison staff) receive more consistent reporting attention, examines temporal trends in personnel data submission, and explores whether countries reporting more personnel categories also demonstrate higher prosecution reporting activity.</p>
+            <div class="feature-highlight">System capacity data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("🏛️", key="justice_card", use_container_width=True, help="Click to view Justice System Capacity",
+                  on_click=navigation.go_to, args=("🏛️ Justice System Capacity",))
+    with col2:
+        st.markdown(f"""
+        <div class="feature-card">
+            <div class="feature-icon">🛡️</div>
+            <h3 class="feature-title">Safety & SDG Indicators</h3>
+            <p class="feature-description">Hypothesis: SDG 16.1 indicators—including homicide victimization rates, violence prevalence across crime types, and subjective safety perceptions—can be analyzed alongside police reporting rates and bribery indices to identify patterns in crime reporting behavior. Tests whether countries showing divergence between low safety perception and low official crime statistics also exhibit low police reporting rates, suggesting potential underreporting dynamics, and examines whether higher bribery prevalence correlates with reduced trust in formal reporting mechanisms.</p>
+            <div class="feature-highlight">{mode.text['safety_highlight']}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+        st.button("🛡️", key="safety_card", use_container_width=True, help="Click to view Safety & SDG Indicators",
+                  on_click=navigation.go_to, args=("🛡️ Safety & SDG Indicators",))
+
+    # Key Insights with real data
+    st.markdown('<h2 class="section-title">Key Insights & Findings</h2>',
+                unsafe_allow_html=True)
+
+    # Calculate insights from data
+    countries_count = total_countries
+    years_covered = data.column_values(mode, 'offences', selected_region, 'Year')
+    year_range = f"{min(years_covered)}-{max(years_covered)}" if len(
+        years_covered) > 0 else "Multiple years"
+    trafficking_countries = len(data.column_values(
+        mode, 'trafficking', selected_region, 'Country'))
+
+    st.markdown(f"""
+    <div class="insights-wrapper">
+        <div class="insights-grid">
+            <div class="insight-item">
+                <div class="insight-icon">🌏</div>
+                <h4 class="insight-heading">General Crime Reporting</h4>
+                <p class="insight-text">{countries_count} countries submit general crime data (rape, sexual violence, kidnapping) in {region_display} spanning {year_range}, showing which locations report broad offense categories to international databases.</p>
+            </div>
+            <div class="insight-item">
+                <div class="insight-icon">📊</div>
+                <h4 class="insight-heading">Trafficking Reporting</h4>
+                <p class="insight-text">{trafficking_countries} countries submit trafficking-specific data in {region_display}, including {trafficking_countries - countries_count if trafficking_countries > countries_count else 0} that only report trafficking (separate dataset with broader country coverage).</p>
+            </div>
+            <div class="insight-item">
+                <div class="insight-icon">⚖️</div>
+                <h4 class="insight-heading">Conviction Counts</h4>
+                <p class="insight-text">{total_convicted:,} total convictions recorded (actual quantitative data), representing judicial outcomes across reporting countries.</p>
+            </div>
+            <div class="insight-item">
+                <div class="insight-icon">🔍</div>
+                <h4 class="insight-heading">Data Structure</h4>
+                <p class="insight-text">Multi-dimensional records tracking crime types, demographics, and temporal patterns. Most metrics show reporting coverage, not incident totals.</p>
+            </div>
+        </div>
+    </div>
+    """,
+                unsafe_allow_html=True)
+
+    st.markdown("""
+    <div class="methodology-section">
+        <h2 class="section-title" style="color: #2d3748;">Data Sources & Understanding the Metrics</h2>
+        <div style="display: grid; grid-template-columns: repeat(3, 1fr); gap: 30px; margin-top: 30px;">
+            <div class="methodology-item">
+                <h4>📊 Data Coverage vs Counts</h4>
+                <p>Most visualizations show data <strong>reporting patterns</strong> (which countries/years/categories have records) rather than incident magnitudes. Only conviction data contains actual quantitative counts.</p>
+            </div>
+            <div class="methodology-item">
+                <h4>🔍 Analysis Interpretation</h4>
+                <p>Charts reveal geographic and temporal coverage of crime reporting infrastructure, helping identify gaps in data collection systems.</p>
+            </div>
+            <div class="methodology-item">
+                <h4>✅ Data Limitations</h4>
+                <p>Source datasets primarily contain categorical records. Trends reflect changes in reporting coverage over time, not necessarily changes in actual crime rates.</p>
+            </div>
+        </div>
+    </div>
+    """,
+                unsafe_allow_html=True)
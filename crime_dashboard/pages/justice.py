@@ -0,0 +1,301 @@
+"""Justice System Capacity page: prosecutions, personnel and the prosecution map."""
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from crime_dashboard import data, page_tables, profiling, templates
+
+
+def render(mode, selected_region):
+    """Render the Justice System Capacity page for ``selected_region``"""
+    filtered_prosecuted = data.region_frame(mode, 'prosecuted', selected_region)
+    filtered_personnel = data.region_frame(mode, 'personnel', selected_region)
+
+    st.markdown(templates.intro_box(
+        "🏛️ Justice System Capacity: Personnel & Prosecutions",
+        f"Analysis of criminal justice infrastructure including personnel deployment and prosecution activity for serious crimes. This page shows the operational capacity and responsiveness of justice systems {mode.text['justice_scope']}."),
+                unsafe_allow_html=True)
+
+    col1, col2, col3, col4 = st.columns(4)
+    with col1:
+        if len(filtered_prosecuted) > 0:
+            prosecution_years = ['All Years', *data.column_values(
+                mode, 'prosecuted', selected_region, 'Year')]
+            selected_year_prosecution = st.selectbox(
+                "Year",
+                prosecution_years,
+                key="year_prosecution")
+        else:
+            selected_year_prosecution = 'All Years'
+    with col2:
+        if len(filtered_prosecuted) > 0:
+            crime_cats_pros = ['All Categories', *data.column_values(
+                mode, 'prosecuted', selected_region, 'Category')]
+            selected_crime_prosecution = st.selectbox("Crime Category",
+                                                      crime_cats_pros,
+                                                      key="crime_prosecution")
+        else:
+            selected_crime_prosecution = 'All Categories'
+    with col3:
+        if len(filtered_personnel) > 0:
+            groups = ['All Personnel Types', *data.column_values(
+                mode, 'personnel', selected_region, 'Group')]
+            selected_group = st.selectbox("Personnel Type",
+                                          groups,
+                                          key="group")
+        else:
+            selected_group = 'All Personnel Types'
+    with col4:
+        if len(filtered_prosecuted) > 0:
+            subregions_pros = ['All Subregions', *data.column_values(
+                mode, 'prosecuted', selected_region, 'Subregion')]
+            selected_subregion_pros = st.selectbox("Subregion",
+                                                   subregions_pros,
+                                                   key="subregion_pros")
+        else:
+            selected_subregion_pros = 'All Subregions'
+
+    # Prosecution and personnel tables for this region and filter combination
+    prosecution = data.aggregation_service().tables(
+        page_tables.prosecution_tables, 'prosecuted', (mode.key, selected_region),
+        data.region_index(mode, 'prosecuted', selected_region),
+        year=None if selected_year_prosecution == 'All Years' else selected_year_prosecution,
+        category=None if selected_crime_prosecution == 'All Categories' else selected_crime_prosecution,
+        subregion=None if selected_subregion_pros == 'All Subregions' else selected_subregion_pros)
+    personnel = data.aggregation_service().tables(
+        page_tables.personnel_tables, 'personnel', (mode.key, selected_region),
+        data.region_index(mode, 'personnel', selected_region),
+        group=None if selected_group == 'All Personnel Types' else selected_group)
+
+    # Statistics
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    prosecuted_count = prosecution['records']
+    personnel_count = personnel['records']
+    countries_prosecuting = prosecution['countries']
+    year_display = selected_year_prosecution if selected_year_prosecution != 'All Years' else 'All Years'
+
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{prosecuted_count:,}</div>
+            <div class="stat-label">Prosecution Records</div>
+            <div class="stat-change negative">{year_display}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{countries_prosecuting}</div>
+            <div class="stat-label">Countries Prosecuting</div>
+            <div class="stat-change negative">With prosecution data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{personnel_count:,}</div>
+            <div class="stat-label">Personnel Records</div>
+            <div class="stat-change negative">In database</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        personnel_countries = personnel['countries']
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{personnel_countries}</div>
+            <div class="stat-label">Personnel Countries</div>
+            <div class="stat-change negative">Reporting data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    # Add spacing between stats and charts
+    st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+
+    # Charts in connected white containers
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Prosecutions by Crime Category Over Time",
+            "Compares prosecution activity between rape and drug trafficking cases across years. This reveals how justice systems are allocating resources and which crime types are receiving more prosecutorial attention over time.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if prosecution['records'] > 0:
+            category_yearly_pros = prosecution['category_yearly']
+
+            def build_fig():
+                fig = px.bar(category_yearly_pros,
+                             x='Year',
+                             y='count',
+                             color='Category',
+                             barmode='group',
+                             color_discrete_map={
+                                 'Rape': '#667eea',
+                                 'Drug trafficking': '#ec4899'
+                             })
+                fig.update_layout(height=300,
+                                  margin=dict(l=40, r=20, t=10, b=100),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', 
+                                            tickfont=dict(color='#2d3748'),
+                                            title=dict(text='Year', font=dict(color='#2d3748'))),
+                                  yaxis=dict(gridcolor='#cbd5e0', 
+                                            tickfont=dict(color='#2d3748'),
+                                            title=dict(text='Prosecution Records', font=dict(color='#2d3748'))),
+                                  legend=dict(
+                                      orientation='h',
+                                      yanchor='top',
+                                      y=-0.35,
+                                      xanchor='center',
+                                      x=0.5,
+                                      font=dict(color='#2d3748', size=8),
+                                      title=dict(text='Crime Type', font=dict(color='#2d3748', size=8))))
+                return fig
+
+            fig = data.figure_cache().figure('justice/category_yearly', category_yearly_pros, build_fig)
+            profiling.plotly_chart(fig, 'justice/category_yearly', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Top 10 Countries by Prosecutions",
+            "Ranks countries by total prosecution records, identifying nations with the most active prosecution efforts. Higher numbers indicate robust judicial systems actively pursuing serious crime cases.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if prosecution['records'] > 0:
+            country_prosecution = prosecution['country_counts']
+
+            def build_fig():
+                fig = go.Figure()
+                fig.add_trace(
+                    go.Bar(y=country_prosecution['Country'],
+                           x=country_prosecution['count'],
+                           orientation='h',
+                           marker=dict(color='#764ba2')))
+                fig.update_layout(height=300,
+                                  margin=dict(l=150, r=20, t=10, b=40),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                                  yaxis=dict(tickfont=dict(color='#2d3748')),
+                                  showlegend=False)
+                return fig
+
+            fig = data.figure_cache().figure('justice/countries', country_prosecution, build_fig)
+            profiling.plotly_chart(fig, 'justice/countries', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Second row of charts
+    col1, col2 = st.columns(2, gap="small")
+    
+    with col1:
+        st.markdown(templates.chart_card(
+            "Personnel Distribution by Type",
+            f"Shows the distribution of criminal justice personnel across different roles (Police, Judges, Prosecutors, etc.). This reveals the composition and structure of justice system workforce {mode.text['personnel_scope']}.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if personnel['records'] > 0:
+            group_counts = personnel['group_counts']
+
+            def build_fig():
+                fig = go.Figure()
+                fig.add_trace(
+                    go.Bar(y=group_counts['Group'],
+                           x=group_counts['count'],
+                           orientation='h',
+                           marker=dict(color='#06b6d4')))
+                fig.update_layout(height=300,
+                                  margin=dict(l=150, r=20, t=10, b=40),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                                  yaxis=dict(tickfont=dict(color='#2d3748')),
+                                  showlegend=False)
+                return fig
+
+            fig = data.figure_cache().figure('justice/personnel_groups', group_counts, build_fig)
+            profiling.plotly_chart(fig, 'justice/personnel_groups', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(templates.chart_card(
+            "Regional Prosecution Distribution",
+            "Displays prosecution activity across world subregions. This geographic breakdown helps identify areas with strong judicial enforcement and regions where prosecution systems may be less developed or documented.",
+            variant='ink'), unsafe_allow_html=True)
+
+        if prosecution['records'] > 0:
+            subregion_pros = prosecution['subregion_counts']
+
+            def build_fig():
+                fig = go.Figure()
+                fig.add_trace(
+                    go.Bar(x=subregion_pros['Subregion'],
+                           y=subregion_pros['count'],
+                           marker=dict(color='#ec4899')))
+                fig.update_layout(height=300,
+                                  margin=dict(l=40, r=20, t=10, b=100),
+                                  plot_bgcolor='white',
+                                  paper_bgcolor='white',
+                                  xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748'), tickangle=-45),
+                                  yaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                                  showlegend=False)
+                return fig
+
+            fig = data.figure_cache().figure('justice/subregions', subregion_pros, build_fig)
+            profiling.plotly_chart(fig, 'justice/subregions', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # World map visualization - full width
+    st.markdown(templates.chart_card(
+        f"{mode.text['map_title']}",
+        f"Interactive world map showing prosecution records by country. Darker colors indicate higher prosecution activity. Hover over countries to see specific data. This visualization reveals {mode.text['map_scope']}.",
+        variant='ink'), unsafe_allow_html=True)
+
+    if prosecution['records'] > 0:
+        country_map_data = prosecution['country_map']
+
+        def build_fig():
+            fig = px.choropleth(country_map_data,
+                               locations='ISO3',
+                               locationmode='ISO-3',
+                               hover_name='Country',
+                               color='Prosecution Records',
+                               color_continuous_scale=[[0, '#a78bfa'], [0.5, '#7c3aed'], [1, '#4c1d95']],
+                               labels={'Prosecution Records': 'Records'})
+            fig.update_layout(height=500,
+                              margin=dict(l=0, r=0, t=0, b=80),
+                              paper_bgcolor='white',
+                              geo=dict(showframe=False,
+                                      showcoastlines=True,
+                                      projection_type='natural earth',
+                                      bgcolor='white'),
+                              coloraxis_colorbar=dict(
+                                  orientation='h',
+                                  yanchor='top',
+                                  y=-0.15,
+                                  xanchor='center',
+                                  x=0.5,
+                                  thickness=15,
+                                  len=0.5,
+                                  tickfont=dict(color='#000000', size=10),
+                                  title=dict(text='Records', font=dict(color='#000000', size=10))))
+            fig.update_traces(hovertemplate='<b>%{hovertext}</b><br>Prosecution Records: %{z}<extra></extra>')
+            return fig
+
+        fig = data.figure_cache().figure('justice/prosecution_map', country_map_data, build_fig)
+        profiling.plotly_chart(fig, 'justice/prosecution_map', use_container_width=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)
@@ -0,0 +1,247 @@
+"""Overview page: offence reporting trends answered from the count cube."""
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from crime_dashboard import data, profiling, templates
+
+
+def render(mode, selected_region):
+    """Render the Overview page for ``selected_region``"""
+    #  Overview narrative with white background
+    st.markdown("""
+    <div style="background: white; border-radius: 12px 12px 0 0; padding: 25px 25px 15px 25px; margin-bottom: 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+        <p style="color: #4a5568; font-size: 1rem; line-height: 1.6; margin: 0;">
+            Explore crime category reporting patterns from the offences dataset. Filter by year, subregion, and crime type to analyze which countries submit data across different offense categories, and track reporting trends over time through interactive visualizations.
+        </p>
+    </div>
+    <div style="background: white; border-radius: 0 0 12px 12px; padding: 0 25px 25px 25px; margin-bottom: 20px; margin-top: 0; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);">
+    """, unsafe_allow_html=True)
+    
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        years_available = data.column_values(mode, 'offences',
+                                             selected_region, 'Year')
+        year_options = ['All Years', *years_available]
+        selected_year = st.selectbox(
+            "Year",
+            year_options if len(years_available) > 0 else ['All Years', 2020],
+            key="year")
+
+    with col2:
+        subregions = ['All Subregions', *data.column_values(
+            mode, 'offences', selected_region, 'Subregion')]
+        selected_subregion = st.selectbox("Subregion",
+                                          subregions,
+                                          key="subregion")
+
+    with col3:
+        categories = ['All Categories', *data.column_values(
+            mode, 'offences', selected_region, 'Category')]
+        selected_category = st.selectbox("Crime Type",
+                                         categories,
+                                         key="crime_type")
+    
+    st.markdown('</div>', unsafe_allow_html=True)
+
+    # Slice the precomputed count cube instead of filtering raw rows
+    region_column = mode.region_column
+    filtered_cube = data.load_offences_cube(region_column).slice(
+        **{region_column: data.region_options(mode.key)[selected_region]},
+        Subregion=None if selected_subregion == 'All Subregions' else selected_subregion,
+        Category=None if selected_category == 'All Categories' else selected_category)
+
+    # Statistics cards
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    # Handle "All Years" option
+    if selected_year == 'All Years':
+        current_year_cube = filtered_cube
+    else:
+        current_year_cube = filtered_cube.slice(Year=selected_year)
+
+    total_records = current_year_cube.total()
+    countries_reporting = current_year_cube.distinct('Country')
+
+    with col1:
+        year_label = "All Years" if selected_year == 'All Years' else f"Year {selected_year}"
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{total_records:,}</div>
+            <div class="stat-label">Data Records</div>
+            <div class="stat-change negative">{year_label}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{countries_reporting}</div>
+            <div class="stat-label">Countries Reporting</div>
+            <div class="stat-change negative">Submitting data</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        subregion_count = filtered_cube.distinct('Subregion')
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{subregion_count}</div>
+            <div class="stat-label">Subregions</div>
+            <div class="stat-change negative">With data coverage</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        crime_types = filtered_cube.distinct('Category')
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{crime_types}</div>
+            <div class="stat-label">Categories Tracked</div>
+            <div class="stat-change negative">Crime types</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    # Add spacing between stats and charts
+    st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+
+    # Charts
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Data Reporting Trends",
+            "Tracks how many crime category records are submitted to databases each year. Rising trends indicate improved data collection, while dips may signal gaps in reporting infrastructure.",
+            variant='note'), unsafe_allow_html=True)
+
+        # Time series data
+        yearly_counts = filtered_cube.rollup('Year')
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Scatter(x=yearly_counts['Year'],
+                           y=yearly_counts['count'],
+                           mode='lines+markers',
+                           name='Incidents',
+                           line=dict(color='#667eea', width=3),
+                           marker=dict(size=10, color='#667eea')))
+            fig.update_layout(height=300,
+                              margin=dict(l=40, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('overview/yearly_trend', yearly_counts, build_fig)
+        profiling.plotly_chart(fig, 'overview/yearly_trend', use_container_width=True, key="chart1")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Top Countries by Data Records",
+            "Identifies which countries contribute the most crime category records to the database. Higher counts indicate more comprehensive data reporting systems for the selected year.",
+            variant='note'), unsafe_allow_html=True)
+
+        # Top countries
+        country_counts = current_year_cube.rollup('Country')
+        country_counts = country_counts.sort_values('count',
+                                                    ascending=False).head(10)
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(y=country_counts['Country'],
+                       x=country_counts['count'],
+                       orientation='h',
+                       marker=dict(color='#764ba2')))
+            fig.update_layout(height=300,
+                              margin=dict(l=200, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('overview/top_countries', country_counts, build_fig)
+        profiling.plotly_chart(fig, 'overview/top_countries', use_container_width=True, key="chart2")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Subregion breakdown
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Distribution by Subregion",
+            "Shows the geographic distribution of crime data reporting across different subregions. Each segment represents the proportion of records contributed by that area.",
+            variant='note'), unsafe_allow_html=True)
+
+        subregion_counts = current_year_cube.rollup('Subregion')
+
+        # Custom cyan/light blue palette without white
+        cyan_palette = ['#06b6d4', '#22d3ee', '#67e8f9', '#a5f3fc', '#0891b2', '#0e7490', '#155e75', '#164e63', '#14b8a6', '#2dd4bf', '#5eead4', '#99f6e4']
+        def build_fig():
+            fig = px.pie(subregion_counts,
+                         values='count',
+                         names='Subregion',
+                         color_discrete_sequence=cyan_palette)
+            fig.update_traces(textfont=dict(color='#2d3748', size=11))
+            fig.update_layout(height=300,
+                              margin=dict(l=5, r=5, t=0, b=60),
+                              paper_bgcolor='white',
+                              font=dict(color='#2d3748', size=10),
+                              legend=dict(
+                                  orientation='h',
+                                  yanchor='top',
+                                  y=-0.15,
+                                  xanchor='center',
+                                  x=0.5,
+                                  font=dict(color='#2d3748', size=8)),
+                              showlegend=True)
+            return fig
+
+        fig = data.figure_cache().figure('overview/subregions', subregion_counts, build_fig)
+        profiling.plotly_chart(fig, 'overview/subregions', use_container_width=True, key="chart3")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Crime Categories",
+            "Displays the most frequently reported crime categories in the database. Categories with more records indicate areas with stronger data collection and reporting mechanisms.",
+            variant='note'), unsafe_allow_html=True)
+
+        category_counts = current_year_cube.rollup('Category')
+        category_counts = category_counts.sort_values('count',
+                                                      ascending=True).tail(10)
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(y=category_counts['Category'],
+                       x=category_counts['count'],
+                       orientation='h',
+                       marker=dict(color='#667eea')))
+            fig.update_layout(height=300,
+                              margin=dict(l=150, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('overview/categories', category_counts, build_fig)
+        profiling.plotly_chart(fig, 'overview/categories', use_container_width=True, key="chart4")
+        
+        st.markdown('</div>', unsafe_allow_html=True)
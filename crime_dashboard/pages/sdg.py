@@ -0,0 +1,886 @@
+"""Safety & SDG Indicators page: SDG 16 indicators with per-indicator charts."""
+import streamlit as st
+import plotly.graph_objects as go
+import plotly.express as px
+
+from crime_dashboard import (data, page_tables, profiling, sdg_series,
+                             templates)
+
+
+def render(mode, selected_region):
+    """Render the Safety & SDG Indicators page for ``selected_region``"""
+    filtered_sdg = data.region_frame(mode, 'sdg_safety', selected_region)
+
+    st.markdown("""
+    <div style="background: white; border-radius: 12px !important; padding: 25px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin-bottom: 30px; overflow: hidden; border-top-left-radius: 12px; border-top-right-radius: 12px; border-bottom-left-radius: 12px; border-bottom-right-radius: 12px;">
+        <h2 style="color: #2d3748; font-size: 1.5rem; font-weight: 700; margin: 0 0 15px 0; text-align: center;">🛡️ Safety Perception & SDG Indicators</h2>
+        <p style="color: #4a5568; font-size: 0.95rem; margin: 0; text-align: center; line-height: 1.6;">
+            Explore UN Sustainable Development Goal indicators through interactive controls. Select an indicator, filter by year and gender, and dive deep into specific countries to analyze safety and crime data.
+        </p>
+    </div>
+    """,
+                unsafe_allow_html=True)
+    
+    st.markdown('<br>', unsafe_allow_html=True)
+
+    # INTERACTIVE CONTROLS SECTION
+    col1, col2, col3 = st.columns(3)
+
+    with col1:
+        # SDG Indicator Selector
+        indicator_options = sdg_series.SDG_INDICATORS
+        selected_indicator = st.selectbox("Select SDG Indicator",
+                                          options=list(
+                                              indicator_options.keys()),
+                                          key="sdg_indicator")
+
+    with col2:
+        # Year Range Filter
+        if len(filtered_sdg) > 0:
+            sdg_years = data.column_values(mode, 'sdg_safety',
+                                           selected_region, 'Year')
+            min_year, max_year = int(sdg_years[0]), int(sdg_years[-1])
+            year_range = st.slider("Year Range",
+                                   min_value=min_year,
+                                   max_value=max_year,
+                                   value=(min_year, max_year),
+                                   key="sdg_year_range")
+        else:
+            year_range = (2000, 2023)
+
+    with col3:
+        # Gender Filter
+        gender_options = ['All Genders', 'Male', 'Female', 'Both']
+        selected_gender = st.selectbox("Gender Filter",
+                                       options=gender_options,
+                                       key="sdg_gender")
+
+    # Additional filters row
+    col1, col2 = st.columns(2)
+
+    with col1:
+        # Country selector
+        if len(filtered_sdg) > 0:
+            countries = ['All Countries', *data.column_values(
+                mode, 'sdg_safety', selected_region, 'Geo')]
+            selected_country = st.selectbox(
+                "Select Country (for detailed view)",
+                options=countries,
+                key="sdg_country")
+        else:
+            selected_country = 'All Countries'
+
+    with col2:
+        # Subregion selector
+        if len(filtered_sdg) > 0:
+            subregions = ['All Subregions', *data.column_values(
+                mode, 'sdg_safety', selected_region, 'Subregion')]
+            selected_subregion = st.selectbox("Select Subregion",
+                                              options=subregions,
+                                              key="sdg_subregion")
+        else:
+            selected_subregion = 'All Subregions'
+
+    # SDG tables for this region, indicator and filter combination
+    sdg = data.aggregation_service().tables(
+        page_tables.sdg_tables, 'sdg_safety', (mode.key, selected_region),
+        data.region_index(mode, 'sdg_safety', selected_region),
+        indicator=selected_indicator,
+        year_range=tuple(year_range),
+        sex=None if selected_gender == 'All Genders' else selected_gender,
+        country=None if selected_country == 'All Countries' else selected_country,
+        subregion=None if selected_subregion == 'All Subregions' else selected_subregion)
+
+    # Display filtered statistics
+    st.markdown("""
+    <div style="background: white; border-radius: 12px; padding: 20px; box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1); margin-bottom: 20px; overflow: hidden;">
+        <h3 style="color: #2d3748; font-size: 1.2rem; font-weight: 600; margin: 0 0 15px 0; text-align: center;">📊 Filtered Data Summary</h3>
+    """, unsafe_allow_html=True)
+    
+    st.markdown('<div style="padding: 0 10px;">', unsafe_allow_html=True)
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    with col1:
+        st.markdown(f"""
+        <div class="stat-card">
+            <p class="stat-number">{sdg['records']:,}</p>
+            <p class="stat-label">Records Found</p>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        unique_years = sdg['years']
+        st.markdown(f"""
+        <div class="stat-card">
+            <p class="stat-number">{unique_years}</p>
+            <p class="stat-label">Years Covered</p>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        unique_countries = sdg['countries']
+        st.markdown(f"""
+        <div class="stat-card">
+            <p class="stat-number">{unique_countries}</p>
+            <p class="stat-label">Countries</p>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        unique_series = sdg['series']
+        st.markdown(f"""
+        <div class="stat-card">
+            <p class="stat-number">{unique_series}</p>
+            <p class="stat-label">Indicators</p>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    st.markdown('</div>', unsafe_allow_html=True)  # Close padding div
+    st.markdown('</div>', unsafe_allow_html=True)  # Close statistics container
+
+    # Show visualizations if data available
+    if sdg['records'] == 0:
+        st.warning(
+            "⚠️ No data available for the selected filters. Try adjusting your filter selections."
+        )
+    else:
+        # Dynamic visualizations based on selected indicator
+
+        # Intentional Homicide visualizations
+        if selected_indicator == "📊 Intentional Homicide":
+            st.markdown(templates.chart_card(
+                "📊 Intentional Homicide Rates Analysis",
+                "Tracking homicide victimization rates to monitor SDG 16.1 (reduce violence and death rates)",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Trend Over Time by Gender",
+                    "<strong>What it shows:</strong> This line chart displays how homicide data reporting varies by gender (Male, Female, Both) across years.<br> "
+                    "<strong>Purpose:</strong> Helps identify reporting patterns, gender gaps in data collection, and changes in data availability over time to assess the completeness of gender-disaggregated statistics."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    yearly_gender = sdg['yearly_gender']
+                    def build_fig():
+                        fig = px.line(yearly_gender,
+                                      x='Year',
+                                      y='Records',
+                                      color='Sex',
+                                      color_discrete_map={
+                                          'Male': '#10b981',
+                                          'Female': '#ef4444',
+                                          'Both': '#f59e0b'
+                                      },
+                                      markers=True)
+                        fig.update_traces(line=dict(width=3), marker=dict(size=8))
+                        fig.update_layout(height=300,
+                                          margin=dict(l=30, r=30, t=20, b=80),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/homicide_yearly_gender', yearly_gender, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/homicide_yearly_gender', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Top 10 Countries",
+                    "<strong>What it shows:</strong> Horizontal bar chart ranking the top 10 countries by number of homicide data records submitted.<br> "
+                    "<strong>Purpose:</strong> Identifies which countries are most active in reporting homicide statistics, indicating strong data collection systems and transparency in crime reporting."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    country_counts = sdg['country_counts']
+                    def build_fig():
+                        fig = go.Figure()
+                        fig.add_trace(
+                            go.Bar(y=country_counts['Geo'][::-1],
+                                   x=country_counts['Records'][::-1],
+                                   orientation='h',
+                                   marker=dict(color='#553c9a')))
+                        fig.update_layout(height=300,
+                                          margin=dict(l=10, r=30, t=0, b=0),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          xaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          yaxis=dict(title=dict(text='Country', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/homicide_countries', country_counts, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/homicide_countries', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Regional Comparison",
+                f"<strong>What it shows:</strong> Gradient bar chart comparing homicide data records across {mode.text['homicide_regions']}.<br> "
+                "<strong>Purpose:</strong> Reveals regional disparities in data reporting capacity and helps identify areas that may need support in strengthening their crime statistics infrastructure."), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                regional_data = sdg['regional_data']
+                def build_fig():
+                    fig = go.Figure()
+                    fig.add_trace(
+                        go.Bar(y=regional_data['Region'],
+                               x=regional_data['Records'],
+                               orientation='h',
+                               marker=dict(color=regional_data['Records'],
+                                          colorscale=[[0, '#764ba2'], [0.5, '#667eea'], [1, '#4c51bf']],
+                                          showscale=False)))
+                    fig.update_layout(height=300,
+                                      margin=dict(l=30, r=30, t=20, b=80),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      showlegend=False,
+                                      xaxis=dict(gridcolor='#e2e8f0',
+                                                title=dict(text='Data Records', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')),
+                                      yaxis=dict(title=dict(text='Region', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')))
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/homicide_regions', regional_data, build_fig)
+                profiling.plotly_chart(fig, 'sdg/homicide_regions', use_container_width=True)
+            else:
+                st.info("No regional data available")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Human Trafficking visualizations
+        elif selected_indicator == "🚨 Human Trafficking":
+            st.markdown(templates.chart_card(
+                "🚨 Human Trafficking Victims Analysis",
+                "Monitoring trafficking victim rates to support SDG 16.2 (end trafficking and exploitation)",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Yearly Trends",
+                    "<strong>What it shows:</strong> Area chart showing the volume of trafficking victim data reports submitted each year.<br> "
+                    "<strong>Purpose:</strong> Tracks improvements in trafficking detection and reporting systems over time, helping assess whether countries are enhancing their anti-trafficking efforts."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    yearly_data = sdg['yearly_data']
+                    def build_fig():
+                        fig = go.Figure()
+                        fig.add_trace(
+                            go.Scatter(x=yearly_data['Year'],
+                                       y=yearly_data['Records'],
+                                       mode='lines+markers',
+                                       fill='tozeroy',
+                                       line=dict(color='#c53030', width=3),
+                                       marker=dict(size=8, color='#c53030'),
+                                       fillcolor='rgba(197, 48, 48, 0.2)'))
+                        fig.update_layout(height=280,
+                                          margin=dict(l=40, r=60, t=10, b=10),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          showlegend=False)
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/trafficking_yearly', yearly_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/trafficking_yearly', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Gender Breakdown",
+                    "<strong>What it shows:</strong> Pie chart displaying the proportion of trafficking data records by gender category (Male, Female, Both).<br> "
+                    "<strong>Purpose:</strong> Reveals gender dimensions in trafficking reporting and helps identify which populations are most represented in trafficking victim data."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    gender_data = sdg['gender_data']
+                    def build_fig():
+                        fig = px.pie(
+                            gender_data,
+                            values='Records',
+                            names='Sex',
+                            color_discrete_sequence=px.colors.sequential.Purples_r)
+                        fig.update_layout(height=280,
+                                          margin=dict(l=40, r=100, t=20, b=80),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          font=dict(color='#000000'),
+                                          legend=dict(
+                                              orientation='h',
+                                              yanchor='top',
+                                              y=-0.15,
+                                              xanchor='center',
+                                              x=0.5,
+                                              font=dict(color='#000000', size=8)))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/trafficking_gender', gender_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/trafficking_gender', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Country Comparison",
+                "<strong>What it shows:</strong> Vertical bar chart ranking the top 15 countries by volume of trafficking victim data reports.<br> "
+                "<strong>Purpose:</strong> Identifies which nations have the most comprehensive trafficking data collection, potentially indicating strong detection systems or high trafficking prevalence."), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                country_data = sdg['country_data']
+                def build_fig():
+                    fig = go.Figure()
+                    fig.add_trace(
+                        go.Bar(x=country_data['Geo'],
+                               y=country_data['Records'],
+                               marker=dict(color='#4c51bf')))
+                    fig.update_layout(height=300,
+                                      margin=dict(l=20, r=50, t=0, b=0),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      yaxis=dict(gridcolor='#e2e8f0',
+                                                 title=dict(text='Data Records', font=dict(color='#000000')),
+                                                 tickfont=dict(color='#000000')),
+                                      xaxis=dict(tickangle=-45,
+                                                title=dict(text='Country', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')))
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/trafficking_countries', country_data, build_fig)
+                profiling.plotly_chart(fig, 'sdg/trafficking_countries', use_container_width=True)
+            else:
+                st.info("No country data available")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Safety Perception visualizations
+        elif selected_indicator == "🌃 Safety Perception":
+            st.markdown(templates.chart_card(
+                "🌃 Perception of Safety Analysis",
+                "Proportion of population feeling safe walking alone, supporting SDG 11.7 (safe, inclusive public spaces)",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Trends Over Years",
+                    "<strong>What it shows:</strong> Bar chart showing how many countries reported safety perception data each year.<br> "
+                    "<strong>Purpose:</strong> Monitors the growth in data collection on public safety perceptions, crucial for measuring SDG 11.7 progress on safe and inclusive public spaces."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    yearly_data = sdg['yearly_data']
+                    def build_fig():
+                        fig = px.bar(yearly_data,
+                                     x='Year',
+                                     y='Records',
+                                     color_discrete_sequence=['#4c51bf'])
+                        fig.update_layout(height=280,
+                                          margin=dict(l=40, r=60, t=10, b=10),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/safety_yearly', yearly_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/safety_yearly', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Gender Comparison",
+                    "<strong>What it shows:</strong> Bar chart comparing the number of safety perception data records by gender category.<br> "
+                    "<strong>Purpose:</strong> Examines whether safety perception data adequately captures both male and female perspectives, essential for understanding gender differences in feeling safe."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    gender_data = sdg['gender_data']
+                    def build_fig():
+                        fig = px.bar(gender_data,
+                                     x='Sex',
+                                     y='Records',
+                                     color='Sex',
+                                     color_discrete_map={
+                                         'Male': '#4c51bf',
+                                         'Female': '#c53030',
+                                         'Both': '#553c9a'
+                                     })
+                        fig.update_layout(height=280,
+                                          margin=dict(l=40, r=60, t=10, b=10),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Gender', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          showlegend=False)
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/safety_gender', gender_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/safety_gender', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Country Rankings",
+                "<strong>What it shows:</strong> Horizontal gradient bar chart ranking the top 15 countries by safety perception data volume.<br> "
+                "<strong>Purpose:</strong> Highlights countries leading in measuring public safety perceptions, providing benchmark data for SDG 11.7 on creating safe, inclusive, and accessible public spaces."), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                country_data = sdg['country_data']
+                def build_fig():
+                    fig = go.Figure()
+                    fig.add_trace(
+                        go.Bar(y=country_data['Geo'],
+                               x=country_data['Records'],
+                               orientation='h',
+                               marker=dict(color=country_data['Records'],
+                                           colorscale=[[0, '#764ba2'], [0.5, '#667eea'], [1, '#4c51bf']],
+                                           showscale=False)))
+                    fig.update_layout(height=400,
+                                      margin=dict(l=30, r=30, t=20, b=80),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      xaxis=dict(gridcolor='#e2e8f0',
+                                                 title=dict(text='Data Records', font=dict(color='#000000')),
+                                                 tickfont=dict(color='#000000')),
+                                      yaxis=dict(title=dict(text='Country', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')))
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/safety_countries', country_data, build_fig)
+                profiling.plotly_chart(fig, 'sdg/safety_countries', use_container_width=True)
+            else:
+                st.info("No country data available")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Violence Prevalence visualizations
+        elif selected_indicator == "⚠️ Violence Prevalence":
+            st.markdown(templates.chart_card(
+                "⚠️ Violence and Harassment Prevalence",
+                "Tracking different types of violence to support SDG 16.1 and 11.7 (reduce violence, ensure safe spaces)",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Violence Types Comparison",
+                    "Distribution of data across different violence categories"), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    type_data = sdg['type_data']
+                    def build_fig():
+                        fig = px.bar(type_data,
+                                     x='Records',
+                                     y='ViolenceType',
+                                     orientation='h',
+                                     color='Records',
+                                     color_continuous_scale=[[0, '#764ba2'], [0.5, '#667eea'], [1, '#4c51bf']])
+                        fig.update_layout(height=350,
+                                          margin=dict(l=30, r=30, t=20, b=100),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          xaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          yaxis=dict(title=dict(text='Violence Type', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          coloraxis_colorbar=dict(
+                                              orientation='h',
+                                              yanchor='top',
+                                              y=-0.3,
+                                              xanchor='center',
+                                              x=0.5,
+                                              thickness=15,
+                                              len=0.5,
+                                              title=dict(text='Records', font=dict(color='#000000', size=10)),
+                                              tickfont=dict(color='#000000', size=10)),
+                                          showlegend=False)
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/violence_types', type_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/violence_types', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Trends by Violence Type",
+                    "How reporting for different violence types has evolved over time"), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    yearly_type = sdg['yearly_type']
+                    def build_fig():
+                        fig = px.line(
+                            yearly_type,
+                            x='Year',
+                            y='Records',
+                            color='ViolenceType',
+                            markers=True,
+                            color_discrete_sequence=['#c53030', '#4c51bf', '#d69e2e', '#38a169', '#805ad5', '#dd6b20'])
+                        fig.update_traces(line=dict(width=3), marker=dict(size=8))
+                        fig.update_layout(height=350,
+                                          margin=dict(l=0, r=120, t=0, b=80),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          legend=dict(
+                                              orientation='h',
+                                              yanchor='top',
+                                              y=-0.25,
+                                              xanchor='center',
+                                              x=0.5,
+                                              font=dict(color='#000000', size=8),
+                                              title=dict(font=dict(color='#000000', size=8))))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/violence_yearly', yearly_type, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/violence_yearly', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Gender Breakdown by Type",
+                "Gender-specific distribution across different types of violence"), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                gender_type = sdg['gender_type']
+                def build_fig():
+                    fig = px.bar(gender_type,
+                                 x='ViolenceType',
+                                 y='Records',
+                                 color='Sex',
+                                 barmode='group',
+                                 color_discrete_map={
+                                     'Male': '#4c51bf',
+                                     'Female': '#c53030',
+                                     'Both': '#553c9a'
+                                 })
+                    fig.update_layout(height=300,
+                                      margin=dict(l=30, r=30, t=20, b=120),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      yaxis=dict(gridcolor='#e2e8f0',
+                                                 title=dict(text='Data Records', font=dict(color='#000000')),
+                                                 tickfont=dict(color='#000000')),
+                                      xaxis=dict(tickangle=-45,
+                                                title=dict(text='Violence Type', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')),
+                                      legend=dict(
+                                          orientation='h',
+                                          yanchor='top',
+                                          y=-0.45,
+                                          xanchor='center',
+                                          x=0.5,
+                                          font=dict(color='#000000', size=8),
+                                          title=dict(font=dict(color='#000000', size=8))))
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/violence_gender', gender_type, build_fig)
+                profiling.plotly_chart(fig, 'sdg/violence_gender', use_container_width=True)
+            else:
+                st.info("No data available for this view")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Police Reporting visualizations
+        elif selected_indicator == "👮 Police Reporting":
+            st.markdown(templates.chart_card(
+                "👮 Police Reporting Rates Analysis",
+                "Percentage of crime victims who report incidents, indicating trust in law enforcement",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Reporting Rates by Crime Type",
+                    "Distribution of police reporting data across different crime types",
+                    "<strong>What it shows:</strong> The proportion of data available for each crime category in police reporting statistics.",
+                    "<strong>Purpose:</strong> Identifies which crimes have the most comprehensive reporting data and helps understand data coverage gaps across different crime types."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    crime_data = sdg['crime_data']
+                    def build_fig():
+                        fig = px.pie(
+                            crime_data,
+                            values='Records',
+                            names='CrimeType',
+                            color_discrete_sequence=px.colors.sequential.Blues_r,
+                            hole=0.4)
+                        fig.update_layout(height=350,
+                                          margin=dict(l=30, r=30, t=20, b=80),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          font=dict(color='#000000'),
+                                          legend=dict(
+                                              orientation='h',
+                                              yanchor='top',
+                                              y=-0.25,
+                                              xanchor='center',
+                                              x=0.5,
+                                              font=dict(color='#000000', size=8),
+                                              title=dict(font=dict(color='#000000', size=8))))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/police_crime_types', crime_data, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/police_crime_types', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Gender Comparison",
+                    "Police reporting data by crime type and gender",
+                    "<strong>What it shows:</strong> Comparison of police reporting data between male and female victims across different crime categories.",
+                    "<strong>Purpose:</strong> Reveals gender-specific patterns in crime reporting and helps identify which crimes disproportionately affect different genders."), unsafe_allow_html=True)
+
+                if sdg['records'] > 0:
+                    gender_crime = sdg['gender_crime']
+                    def build_fig():
+                        fig = px.bar(gender_crime,
+                                     x='CrimeType',
+                                     y='Records',
+                                     color='Sex',
+                                     barmode='group',
+                                     color_discrete_map={
+                                         'Male': '#4c51bf',
+                                         'Female': '#c53030',
+                                         'Both': '#553c9a'
+                                     })
+                        fig.update_layout(height=350,
+                                          margin=dict(l=30, r=30, t=20, b=120),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(tickangle=-45,
+                                                    title=dict(text='Crime Type', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          legend=dict(
+                                              orientation='h',
+                                              yanchor='top',
+                                              y=-0.45,
+                                              xanchor='center',
+                                              x=0.5,
+                                              font=dict(color='#000000', size=8),
+                                              title=dict(font=dict(color='#000000', size=8))))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/police_gender', gender_crime, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/police_gender', use_container_width=True)
+                else:
+                    st.info("No data available for this view")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Trends Over Time",
+                "How police reporting data has evolved over time by crime type",
+                "<strong>What it shows:</strong> Yearly trends in the volume of police reporting data for each crime category from past years to present.",
+                "<strong>Purpose:</strong> Tracks how data collection efforts have changed over time and identifies emerging or declining trends in crime reporting for different categories."), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                yearly_crime = sdg['yearly_crime']
+                def build_fig():
+                    fig = px.line(
+                        yearly_crime,
+                        x='Year',
+                        y='Records',
+                        color='CrimeType',
+                        markers=True,
+                        color_discrete_sequence=['#c53030', '#4c51bf', '#d69e2e', '#38a169', '#805ad5', '#dd6b20'])
+                    fig.update_traces(line=dict(width=3), marker=dict(size=8))
+                    fig.update_layout(height=300,
+                                      margin=dict(l=30, r=30, t=20, b=80),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      yaxis=dict(gridcolor='#e2e8f0',
+                                                 title=dict(text='Data Records', font=dict(color='#000000')),
+                                                 tickfont=dict(color='#000000')),
+                                      xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')),
+                                      legend=dict(
+                                          orientation='h',
+                                          yanchor='top',
+                                          y=-0.2,
+                                          xanchor='center',
+                                          x=0.5,
+                                          font=dict(color='#000000', size=8),
+                                          title=dict(font=dict(color='#000000', size=8))))
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/police_yearly', yearly_crime, build_fig)
+                profiling.plotly_chart(fig, 'sdg/police_yearly', use_container_width=True)
+            else:
+                st.info("No data available for this view")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Prison & Bribery visualizations
+        elif selected_indicator == "⚖️ Prison & Bribery":
+            st.markdown(templates.chart_card(
+                "⚖️ Prison Statistics & Bribery Prevalence",
+                "Unsentenced prisoner rates and bribery prevalence, supporting SDG 16 (peaceful and inclusive societies)",
+                variant='section', close=True), unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            col1, col2 = st.columns(2, gap="large")
+
+            with col1:
+                st.markdown(templates.chart_card(
+                    "Prison Data Trends",
+                    "Unsentenced prisoner data reporting trends over time",
+                    "<strong>What it shows:</strong> The number of data records about unsentenced prisoners collected each year.",
+                    "<strong>Purpose:</strong> Tracks transparency and data availability about pretrial detention, a key indicator of justice system efficiency and human rights."), unsafe_allow_html=True)
+
+                yearly_prison = sdg['yearly_prison']
+                if len(yearly_prison) > 0:
+                    def build_fig():
+                        fig = go.Figure()
+                        fig.add_trace(
+                            go.Scatter(x=yearly_prison['Year'],
+                                       y=yearly_prison['Records'],
+                                       mode='lines+markers',
+                                       line=dict(color='#4c51bf', width=3),
+                                       marker=dict(size=10, color='#553c9a')))
+                        fig.update_layout(height=300,
+                                          margin=dict(l=30, r=30, t=20, b=30),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')),
+                                          showlegend=False)
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/prison_yearly', yearly_prison, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/prison_yearly', use_container_width=True)
+                else:
+                    st.info("No prison data available")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            with col2:
+                st.markdown(templates.chart_card(
+                    "Bribery Prevalence",
+                    "Bribery data reporting trends across years",
+                    "<strong>What it shows:</strong> Annual volume of data records about bribery incidents and prevalence.",
+                    "<strong>Purpose:</strong> Monitors corruption transparency and anti-corruption data collection efforts, supporting SDG 16 goals for accountable institutions."), unsafe_allow_html=True)
+
+                yearly_bribery = sdg['yearly_bribery']
+                if len(yearly_bribery) > 0:
+                    def build_fig():
+                        fig = px.area(yearly_bribery,
+                                      x='Year',
+                                      y='Records',
+                                      color_discrete_sequence=['#c53030'])
+                        fig.update_layout(height=300,
+                                          margin=dict(l=30, r=30, t=20, b=30),
+                                          plot_bgcolor='rgba(0,0,0,0)',
+                                          paper_bgcolor='rgba(0,0,0,0)',
+                                          yaxis=dict(gridcolor='#e2e8f0',
+                                                     title=dict(text='Data Records', font=dict(color='#000000')),
+                                                     tickfont=dict(color='#000000')),
+                                          xaxis=dict(title=dict(text='Year', font=dict(color='#000000')),
+                                                    tickfont=dict(color='#000000')))
+                        return fig
+
+                    fig = data.figure_cache().figure('sdg/bribery_yearly', yearly_bribery, build_fig)
+                    profiling.plotly_chart(fig, 'sdg/bribery_yearly', use_container_width=True)
+                else:
+                    st.info("No bribery data available")
+                st.markdown('</div>', unsafe_allow_html=True)
+
+            st.markdown("<br>", unsafe_allow_html=True)
+            st.markdown(templates.chart_card(
+                "Regional Comparison",
+                "Distribution of prison and bribery data across different regions",
+                f"<strong>What it shows:</strong> The volume of prison and bribery data reported from different geographic regions {mode.text['prison_regions']}.",
+                f"<strong>Purpose:</strong> Identifies which regions have better data transparency about justice systems and corruption, revealing {mode.text['governance_scope']}."), unsafe_allow_html=True)
+
+            if sdg['records'] > 0:
+                regional_data = sdg['regional_data']
+                def build_fig():
+                    fig = px.bar(regional_data,
+                                 x='Records',
+                                 y='Region',
+                                 orientation='h',
+                                 color='Records',
+                                 color_continuous_scale=[[0, '#764ba2'], [0.5, '#667eea'], [1, '#4c51bf']])
+                    fig.update_layout(height=300,
+                                      margin=dict(l=30, r=30, t=20, b=100),
+                                      plot_bgcolor='rgba(0,0,0,0)',
+                                      paper_bgcolor='rgba(0,0,0,0)',
+                                      xaxis=dict(gridcolor='#e2e8f0',
+                                                 title=dict(text='Data Records', font=dict(color='#000000')),
+                                                 tickfont=dict(color='#000000')),
+                                      yaxis=dict(title=dict(text='Region', font=dict(color='#000000')),
+                                                tickfont=dict(color='#000000')),
+                                      coloraxis_colorbar=dict(
+                                          orientation='h',
+                                          yanchor='top',
+                                          y=-0.35,
+                                          xanchor='center',
+                                          x=0.5,
+                                          thickness=15,
+                                          len=0.5,
+                                          title=dict(text='Records', font=dict(color='#000000', size=10)),
+                                          tickfont=dict(color='#000000', size=10)),
+                                      showlegend=False)
+                    return fig
+
+                fig = data.figure_cache().figure('sdg/prison_regions', regional_data, build_fig)
+                profiling.plotly_chart(fig, 'sdg/prison_regions', use_container_width=True)
+            else:
+                st.info("No regional data available")
+            st.markdown('</div>', unsafe_allow_html=True)
+
+        # Summary insights card
+        st.markdown(templates.insight_box(
+            f"📋 Key Insights About {selected_indicator}",
+            "The visualizations above show data reporting patterns for the selected indicator across different dimensions. Use the filters to explore specific countries, time periods, and demographic breakdowns to better understand reporting coverage and trends in your area of interest."),
+                    unsafe_allow_html=True)
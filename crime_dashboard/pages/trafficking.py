@@ -0,0 +1,208 @@
+"""Trafficking Analysis page: trafficking indicators by country and dimension."""
+import streamlit as st
+import plotly.graph_objects as go
+
+from crime_dashboard import data, page_tables, profiling, templates
+
+
+def render(mode, selected_region):
+    """Render the Trafficking Analysis page for ``selected_region``"""
+    st.markdown(templates.intro_box(
+        "🔍 Trafficking Data Reporting Patterns",
+        "Coverage of trafficking data in international databases, showing which countries report detection and offence data."),
+                unsafe_allow_html=True)
+
+    col1, col2 = st.columns(2)
+    with col1:
+        trafficking_years = ['All Years', *data.column_values(
+            mode, 'trafficking', selected_region, 'Year')]
+        selected_year_trafficking = st.selectbox(
+            "Year",
+            trafficking_years,
+            key="year_trafficking")
+    with col2:
+        indicators = ['All Indicators', *data.column_values(
+            mode, 'trafficking', selected_region, 'Indicator')]
+        selected_indicator = st.selectbox("Indicator",
+                                          indicators,
+                                          key="indicator")
+
+    # Trafficking tables for this region and filter combination
+    trafficking = data.aggregation_service().tables(
+        page_tables.trafficking_tables, 'trafficking', (mode.key, selected_region),
+        data.region_index(mode, 'trafficking', selected_region),
+        year=None if selected_year_trafficking == 'All Years' else selected_year_trafficking,
+        indicator=None if selected_indicator == 'All Indicators' else selected_indicator)
+
+    # Statistics
+    col1, col2, col3, col4 = st.columns(4, gap="large")
+
+    detected_victims = trafficking['detected_victims']
+    offences_count = trafficking['offences_count']
+    countries_affected = trafficking['countries_affected']
+
+    with col1:
+        year_display = selected_year_trafficking if selected_year_trafficking != 'All Years' else 'All Years'
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{detected_victims:,}</div>
+            <div class="stat-label">Detection Records</div>
+            <div class="stat-change negative">{year_display}</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{offences_count:,}</div>
+            <div class="stat-label">Offence Records</div>
+            <div class="stat-change negative">Data records</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col3:
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{countries_affected}</div>
+            <div class="stat-label">Countries Affected</div>
+            <div class="stat-change negative">In dataset</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+
+    with col4:
+        dimensions = trafficking['dimensions']
+        st.markdown(f"""
+        <div class="stat-card">
+            <div class="stat-number">{dimensions}</div>
+            <div class="stat-label">Data Dimensions</div>
+            <div class="stat-change negative">Analysis areas</div>
+        </div>
+        """,
+                    unsafe_allow_html=True)
+    
+    # Add spacing between stats and charts
+    st.markdown("<div style='margin-top: 30px;'></div>", unsafe_allow_html=True)
+
+    # Charts in one connected container
+    col1, col2 = st.columns(2, gap="small")
+
+    with col1:
+        st.markdown(templates.chart_card(
+            "Trafficking by Indicator Type",
+            "Shows the distribution of trafficking data across different indicator categories. This reveals which aspects of human trafficking (detection, prosecution, conviction, offences) have the most comprehensive data reporting.",
+            variant='ink'), unsafe_allow_html=True)
+
+        indicator_counts = trafficking['indicator_counts']
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(y=indicator_counts['Indicator'],
+                       x=indicator_counts['count'],
+                       orientation='h',
+                       marker=dict(color='#667eea')))
+            fig.update_layout(height=300,
+                              margin=dict(l=150, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('trafficking/indicators', indicator_counts, build_fig)
+        profiling.plotly_chart(fig, 'trafficking/indicators', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    with col2:
+        st.markdown(templates.chart_card(
+            "Top Affected Countries",
+            "Identifies countries with the highest number of trafficking-related data records. Higher record counts indicate more active reporting and data collection efforts in combating human trafficking.",
+            variant='ink'), unsafe_allow_html=True)
+
+        country_trafficking = trafficking['country_counts']
+
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(y=country_trafficking['Country'],
+                       x=country_trafficking['count'],
+                       orientation='h',
+                       marker=dict(color='#764ba2')))
+            fig.update_layout(height=300,
+                              margin=dict(l=200, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('trafficking/countries', country_trafficking, build_fig)
+        profiling.plotly_chart(fig, 'trafficking/countries', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+
+    # Additional analysis charts
+    col1, col2 = st.columns(2, gap="small")
+    
+    with col1:
+        st.markdown(templates.chart_card(
+            "Trafficking by Dimension",
+            "Shows how trafficking data is categorized by different analytical dimensions such as age, sex, citizenship, and exploitation form. This reveals which demographic and contextual factors are most frequently tracked.",
+            variant='ink'), unsafe_allow_html=True)
+        
+        dimension_counts = trafficking['dimension_counts']
+        
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(y=dimension_counts['Dimension'],
+                       x=dimension_counts['count'],
+                       orientation='h',
+                       marker=dict(color='#06b6d4')))
+            fig.update_layout(height=300,
+                              margin=dict(l=150, r=20, t=10, b=40),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              yaxis=dict(tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('trafficking/dimensions', dimension_counts, build_fig)
+        profiling.plotly_chart(fig, 'trafficking/dimensions', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
+    
+    with col2:
+        st.markdown(templates.chart_card(
+            "Regional Distribution",
+            "Displays the geographic distribution of trafficking data reporting across world subregions. This highlights which areas have more comprehensive data collection and which may need enhanced monitoring efforts.",
+            variant='ink'), unsafe_allow_html=True)
+        
+        subregion_counts = trafficking['subregion_counts']
+        
+        def build_fig():
+            fig = go.Figure()
+            fig.add_trace(
+                go.Bar(x=subregion_counts['Subregion'],
+                       y=subregion_counts['count'],
+                       marker=dict(color='#ec4899')))
+            fig.update_layout(height=300,
+                              margin=dict(l=40, r=20, t=10, b=100),
+                              plot_bgcolor='white',
+                              paper_bgcolor='white',
+                              xaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748'), tickangle=-45),
+                              yaxis=dict(gridcolor='#cbd5e0', tickfont=dict(color='#2d3748')),
+                              showlegend=False)
+            return fig
+
+        fig = data.figure_cache().figure('trafficking/subregions', subregion_counts, build_fig)
+        profiling.plotly_chart(fig, 'trafficking/subregions', use_container_width=True)
+        
+        st.markdown('</div>', unsafe_allow_html=True)
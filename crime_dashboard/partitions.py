@@ -0,0 +1,17 @@
+"""Region partitions of the dashboard datasets.
+
+The global region selectbox only ever offers a handful of options, so each
+dataset's bitmap index is split once per data load into one view per
+option. Reruns then look the view (or its rows) up instead of rebuilding a
+boolean mask, and page filters are AND-ed onto the view's region bitmap.
+"""
+
+
+def region_partitions(index, options, column="Region"):
+    """One view of a :class:`crime_dashboard.bitmaps.BitmapIndex` per option.
+
+    ``options`` maps each selectbox option to the list of ``column`` values
+    it covers, or to ``None`` for an option that keeps every row.
+    """
+    return {option: index.restrict(**{column: regions})
+            for option, regions in options.items()}
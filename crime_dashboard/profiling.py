@@ -0,0 +1,153 @@
+"""Opt-in per-section timing of a dashboard rerun.
+
+Enabled with ``?profile=1`` or ``CRIME_DASHBOARD_PROFILE=1``; spans are shown
+in a panel under the page and logged on ``crime_dashboard.profile``.
+"""
+import contextvars
+import json
+import logging
+import os
+import threading
+import time
+from contextlib import contextmanager
+
+import streamlit as st
+
+ENV_VAR = "CRIME_DASHBOARD_PROFILE"
+QUERY_PARAM = "profile"
+
+logger = logging.getLogger("crime_dashboard.profile")
+
+_handler_lock = threading.Lock()
+
+# Spans of the rerun being profiled in this script thread, or None
+_timeline = contextvars.ContextVar("crime_dashboard_timeline", default=None)
+
+
+def enabled():
+    """Whether this rerun should be profiled"""
+    if os.environ.get(ENV_VAR, "") not in ("", "0"):
+        return True
+    return st.query_params.get(QUERY_PARAM, "") not in ("", "0")
+
+
+class Timeline:
+    """Spans recorded during one rerun, in the order they finished"""
+
+    def __init__(self, page, scope):
+        self.page = page
+        self.scope = scope
+        self.spans = []
+        self.depth = 0
+        # Allocation tallies of the spans still open, innermost last
+        self.open = []
+        self.allocations = {}
+        self.start = time.perf_counter()
+
+    def add(self, kind, label, depth, start, **attrs):
+        self.spans.append({
+            'page': self.page,
+            'scope': self.scope,
+            'kind': kind,
+            'label': label,
+            'depth': depth,
+            'offset_ms': round((start - self.start) * 1e3, 3),
+            'ms': round((time.perf_counter() - start) * 1e3, 3),
+            **attrs,
+        })
+
+
+@contextmanager
+def span(kind, label=''):
+    """Time the enclosed block as a ``kind`` section named ``label``"""
+    timeline = _timeline.get()
+    if timeline is None:
+        yield
+        return
+    depth = timeline.depth
+    timeline.depth += 1
+    timeline.open.append({})
+    start = time.perf_counter()
+    try:
+        yield
+    finally:
+        timeline.depth = depth
+        timeline.add(kind, str(label), depth, start, **timeline.open.pop())
+
+
+def allocated(kind, nbytes):
+    """Count ``nbytes`` of ``kind`` buffers against the innermost span and rerun"""
+    timeline = _timeline.get()
+    if timeline is None:
+        return
+    timeline.allocations[kind] = timeline.allocations.get(kind, 0) + nbytes
+    if timeline.open:
+        tally = timeline.open[-1]
+        tally[kind] = tally.get(kind, 0) + nbytes
+
+
+def _attach_handler():
+    """Send the span records to stderr unless logging is configured for them"""
+    with _handler_lock:
+        if logger.handlers:
+            return
+        handler = logging.StreamHandler()
+        handler.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(handler)
+        logger.setLevel(logging.INFO)
+        # The records are already on stderr; don't repeat them via the root
+        logger.propagate = False
+
+
+def start(page, scope='app'):
+    """Begin profiling a rerun of ``page`` if profiling is enabled"""
+    if not enabled():
+        _timeline.set(None)
+        return
+    _attach_handler()
+    _timeline.set(Timeline(page, scope))
+
+
+def active():
+    """Whether the current rerun is being profiled"""
+    return _timeline.get() is not None
+
+
+def plotly_chart(fig, chart, **kwargs):
+    """``st.plotly_chart`` timed as a span labelled by its key or chart id"""
+    with span('plotly_chart', kwargs.get('key') or chart):
+        return st.plotly_chart(fig, **kwargs)
+
+
+def finish(caches):
+    """Log the recorded spans and render the panel; ``caches`` maps name -> stats"""
+    timeline = _timeline.get()
+    _timeline.set(None)
+    if timeline is None:
+        return
+    total_ms = round((time.perf_counter() - timeline.start) * 1e3, 3)
+
+    for record in timeline.spans:
+        logger.info(json.dumps(record, ensure_ascii=False, default=str))
+    logger.info(json.dumps({'page': timeline.page, 'scope': timeline.scope,
+                            'kind': 'rerun', 'ms': total_ms,
+                            'allocations': timeline.allocations,
+                            'caches': caches},
+                           ensure_ascii=False, default=str))
+
+    kinds = sorted(timeline.allocations)
+    allocations = ''.join(f", {kind} {timeline.allocations[kind] / 1024:,.1f} KiB"
+                          for kind in kinds)
+    with st.expander(f"⏱️ Rerun profile ({timeline.scope}): {total_ms:.1f} ms"
+                     f"{allocations}", expanded=True):
+        rows = sorted(timeline.spans, key=lambda record: record['offset_ms'])
+        st.dataframe([{
+            'section': '· ' * record['depth'] + record['kind'],
+            'label': record['label'],
+            'start ms': record['offset_ms'],
+            'ms': record['ms'],
+            **{f'{kind} KiB': round(record.get(kind, 0) / 1024, 1)
+               for kind in kinds},
+        } for record in rows], width='stretch', hide_index=True)
+        st.dataframe([{'cache': name, **stats} for name, stats in caches.items()],
+                     width='stretch', hide_index=True)
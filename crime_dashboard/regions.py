@@ -0,0 +1,61 @@
+"""Region groupings derived from the dataset Region columns.
+
+The SDG safety data uses UN SDG regions rather than the continents the
+dashboard filters on, and the two-region mode folds every region into
+Americas or Asia. Both mappings run over the category codes of the Region
+column, so their cost depends on the number of distinct regions rather than
+the number of rows.
+"""
+import numpy as np
+import pandas as pd
+
+# SDG region -> continent offered by the global region filter
+SDG_REGIONS = {
+    'Sub-saharan Africa': 'Africa',
+    'Northern Africa And Western Asia': 'Africa',
+    'Latin America And The Caribbean': 'Americas',
+    'Central And Southern Asia': 'Asia',
+    'Eastern And South-eastern Asia': 'Asia',
+    'Europe And Northern America': 'Europe',
+    'Oceania': 'Oceania',
+}
+
+
+def map_categories(values, mapping):
+    """Map a categorical Series through ``mapping`` without touching each row.
+
+    Categories missing from ``mapping`` (and missing values) become NaN. The
+    result is categorical over the distinct mapped values.
+    """
+    categories = pd.Index(sorted(set(mapping.values())))
+    lookup = categories.get_indexer(values.cat.categories.map(mapping))
+    # Code -1 (missing) indexes the trailing -1 and stays missing
+    lookup = np.append(lookup, -1)
+    codes = lookup[values.cat.codes.to_numpy()]
+    return pd.Series(pd.Categorical.from_codes(codes, categories=categories),
+                     index=values.index, name=values.name)
+
+
+def to_two_region(region):
+    """Fold a Region value into "Americas", "Asia" or None for two-region mode"""
+    if pd.isna(region):
+        return None
+    r = str(region).strip().lower()
+    if any(x in r for x in ["latin america", "caribbean", "northern america", "america"]):
+        return "Americas"
+    if "asia" in r:
+        return "Asia"
+    return None
+
+
+def two_regions(values):
+    """TwoRegion column for a categorical Region Series.
+
+    ``to_two_region`` runs once per distinct region; rows get the result
+    through their category codes.
+    """
+    mapping = {region: to_two_region(region)
+               for region in values.cat.categories}
+    return map_categories(values, {region: two_region
+                                   for region, two_region in mapping.items()
+                                   if two_region is not None})
@@ -0,0 +1,69 @@
+"""Declared column types for the dashboard datasets.
+
+Dimension columns are stored as pandas ``Categorical`` so equality filters
+and groupbys compare integer codes instead of Python strings. Columns that
+describe the same thing share one vocabulary across every dataset (e.g. the
+SDG ``Geo`` column uses the ``Country`` vocabulary), which keeps the codes
+for a given value identical whichever frame it comes from. ``Year`` is
+narrowed to a 16-bit integer.
+"""
+import pandas as pd
+
+# Column -> vocabulary it draws its categories from
+CATEGORICAL_COLUMNS = {
+    "Country": "Country",
+    "Geo": "Country",
+    "Region": "Region",
+    "Subregion": "Subregion",
+    "Indicator": "Indicator",
+    "Dimension": "Dimension",
+    "Category": "Category",
+    "Sex": "Sex",
+    "Group": "Group",
+    "Series": "Series",
+}
+
+YEAR_COLUMN = "Year"
+YEAR_DTYPE = "int16"
+
+
+def observed_categories(df):
+    """Distinct values of each categorical column, keyed by vocabulary"""
+    vocab = {}
+    for column, domain in CATEGORICAL_COLUMNS.items():
+        if column in df.columns:
+            values = df[column].dropna().unique().tolist()
+            vocab.setdefault(domain, set()).update(values)
+    return {domain: sorted(values) for domain, values in vocab.items()}
+
+
+def merge_vocabularies(vocabularies):
+    """Union several ``observed_categories`` results into sorted vocabularies"""
+    merged = {}
+    for vocab in vocabularies:
+        for domain, values in vocab.items():
+            merged.setdefault(domain, set()).update(values)
+    return {domain: sorted(values) for domain, values in merged.items()}
+
+
+def apply_schema(df, vocabularies=None):
+    """Cast dimension columns to categoricals and Year to a small int.
+
+    With ``vocabularies`` the categoricals use the shared category lists;
+    otherwise each column gets the categories it observes. Re-applying to a
+    frame that is already categorical only recodes it.
+    """
+    df = df.copy(deep=False)
+    for column, domain in CATEGORICAL_COLUMNS.items():
+        if column not in df.columns:
+            continue
+        if vocabularies is not None and domain in vocabularies:
+            dtype = pd.CategoricalDtype(vocabularies[domain])
+        else:
+            dtype = "category"
+        df[column] = df[column].astype(dtype)
+
+    year = df.get(YEAR_COLUMN)
+    if year is not None and year.notna().all():
+        df[YEAR_COLUMN] = year.astype(YEAR_DTYPE)
+    return df
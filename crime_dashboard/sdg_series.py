@@ -0,0 +1,89 @@
+"""Classification of the SDG safety ``Series`` labels.
+
+The Safety & SDG page selects rows by matching indicator patterns against
+``Series`` and charts them by violence or crime type parsed out of the same
+label. There are only a few hundred distinct labels, so each one is
+classified once at load and the result is broadcast to the rows through the
+category codes: a bit per indicator in ``SeriesFlags`` plus categorical
+``ViolenceType`` and ``CrimeType`` columns.
+"""
+import numpy as np
+
+from crime_dashboard.regions import map_categories
+
+# Indicator selectbox option -> case-insensitive Series pattern
+SDG_INDICATORS = {
+    '📊 Intentional Homicide': 'intentional homicide',
+    '🚨 Human Trafficking': 'trafficking',
+    '🌃 Safety Perception': 'feel safe walking',
+    '⚠️ Violence Prevalence': 'Prevalence rate',
+    '👮 Police Reporting': 'Police reporting rate',
+    '⚖️ Prison & Bribery': 'unsentenced|bribery',
+}
+
+# The Prison & Bribery indicator charts its two halves separately
+SERIES_PATTERNS = dict(SDG_INDICATORS,
+                       unsentenced='unsentenced',
+                       bribery='bribery')
+
+SERIES_FLAGS = {name: 1 << bit for bit, name in enumerate(SERIES_PATTERNS)}
+
+VIOLENCE_TYPES = [
+    'physical assault', 'sexual assault', 'sexual violence',
+    'psychological violence', 'harassment', 'robbery'
+]
+
+
+def _violence_type(series_name):
+    for vtype in VIOLENCE_TYPES:
+        if vtype in series_name.lower():
+            return vtype.title()
+    return 'Other'
+
+
+def _crime_type(series_name):
+    if 'physical assault' in series_name.lower():
+        return 'Physical Assault'
+    elif 'sexual assault' in series_name.lower():
+        return 'Sexual Assault'
+    elif 'sexual violence' in series_name.lower():
+        return 'Sexual Violence'
+    elif 'physical violence' in series_name.lower():
+        return 'Physical Violence'
+    elif 'robbery' in series_name.lower():
+        return 'Robbery'
+    return 'Other'
+
+
+def classify_series(df):
+    """Derived ``SeriesFlags``, ``ViolenceType`` and ``CrimeType`` columns.
+
+    ``df['Series']`` must be categorical. Rows with a missing Series get no
+    flags and missing types.
+    """
+    series = df['Series']
+    labels = series.cat.categories
+
+    flags = np.zeros(len(labels) + 1, dtype='uint8')
+    for name, pattern in SERIES_PATTERNS.items():
+        matches = labels.str.contains(pattern, case=False, regex=True)
+        flags[:-1][matches] |= SERIES_FLAGS[name]
+
+    return {
+        # Code -1 (missing) picks the trailing zero
+        'SeriesFlags': flags[series.cat.codes.to_numpy()],
+        'ViolenceType': map_categories(
+            series, {label: _violence_type(label) for label in labels}),
+        'CrimeType': map_categories(
+            series, {label: _crime_type(label) for label in labels}),
+    }
+
+
+def has_flag(df, name):
+    """Boolean mask of the rows whose Series matches ``SERIES_PATTERNS[name]``"""
+    return (df['SeriesFlags'].to_numpy() & SERIES_FLAGS[name]) != 0
+
+
+def flag_values(values, name):
+    """The ``SeriesFlags`` values among ``values`` with the ``name`` bit set"""
+    return [value for value in values if value & SERIES_FLAGS[name]]
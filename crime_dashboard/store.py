@@ -0,0 +1,215 @@
+"""Columnar cache for the dashboard datasets.
+
+The CSVs under ``data/`` are converted to sorted, typed Parquet files under
+``data/_store`` and rebuilt only when a source CSV changes. Run
+``python -m crime_dashboard.store`` to build them ahead of time, and set
+``CRIME_DASHBOARD_DATA_DIR`` to read the CSVs from another directory.
+"""
+import hashlib
+import json
+import os
+import sys
+import tempfile
+import threading
+from contextlib import contextmanager
+from pathlib import Path
+
+import pandas as pd
+
+from crime_dashboard import layout, schema
+
+try:
+    import pyarrow  # noqa: F401
+    HAVE_PYARROW = True
+except ImportError:
+    HAVE_PYARROW = False
+
+try:
+    import fcntl
+except ImportError:  # Windows: only threads within a process are serialised
+    fcntl = None
+
+DATA_DIR = Path(os.environ.get("CRIME_DASHBOARD_DATA_DIR")
+                or Path(__file__).resolve().parent.parent / "data")
+STORE_DIRNAME = "_store"
+LOCK_FILENAME = ".build.lock"
+
+# Serialises stale checks and builds between the threads of this process
+_build_lock = threading.Lock()
+
+# Bump when the stored layout or schema changes so old stores are rebuilt
+STORE_FORMAT = 2
+
+# Dataset name -> source CSV under the data directory
+DATASETS = {
+    "offences": "offences_subset_cleaned.csv",
+    "victims": "victims_subset_cleaned.csv",
+    "trafficking": "cleaned_offences_of_trafficking_in_persons.csv",
+    "convicted": "convicted_focus_rape_trafficking.csv",
+    "personnel": "criminal_justice_personnel_cleaned.csv",
+    "prosecuted": "prosecuted_focus_rape_trafficking.csv",
+    "sdg_safety": "sdg_dataset_perception_of_safety_clean.csv",
+}
+
+
+def _file_hash(path):
+    """SHA-256 of a file, read in chunks"""
+    digest = hashlib.sha256()
+    with open(path, "rb") as f:
+        for chunk in iter(lambda: f.read(1 << 20), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _paths(name, data_dir):
+    data_dir = Path(data_dir)
+    store_dir = data_dir / STORE_DIRNAME
+    return (data_dir / DATASETS[name], store_dir / f"{name}.parquet",
+            store_dir / f"{name}.json")
+
+
+def _write_atomic(path, write):
+    """Write via a temporary file so readers never see a partial file"""
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.",
+                               suffix=".tmp")
+    os.close(fd)
+    tmp = Path(tmp)
+    try:
+        write(tmp)
+        os.replace(tmp, path)
+    finally:
+        if tmp.exists():
+            tmp.unlink()
+
+
+@contextmanager
+def _locked(data_dir):
+    """Hold the build lock of ``data_dir``'s store for this thread and process"""
+    with _build_lock:
+        if fcntl is None:
+            yield
+            return
+        store_dir = Path(data_dir) / STORE_DIRNAME
+        store_dir.mkdir(parents=True, exist_ok=True)
+        with open(store_dir / LOCK_FILENAME, "a") as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+
+def _read_manifest(manifest_path):
+    try:
+        return json.loads(manifest_path.read_text())
+    except (OSError, ValueError):
+        return None
+
+
+def _write_manifest(manifest_path, manifest):
+    _write_atomic(manifest_path,
+                  lambda tmp: tmp.write_text(json.dumps(manifest, indent=2)))
+
+
+def is_fresh(name, data_dir=DATA_DIR):
+    """Whether the stored copy of a dataset matches its source CSV"""
+    csv_path, parquet_path, manifest_path = _paths(name, data_dir)
+    manifest = _read_manifest(manifest_path)
+    if (manifest is None or manifest.get("format") != STORE_FORMAT
+            or not parquet_path.exists()):
+        return False
+
+    if not csv_path.exists():
+        # Deployed without the raw CSVs: the store is the source of truth
+        return True
+
+    stat = csv_path.stat()
+    if (manifest.get("size") == stat.st_size
+            and manifest.get("mtime_ns") == stat.st_mtime_ns):
+        return True
+
+    if manifest.get("sha256") != _file_hash(csv_path):
+        return False
+
+    # Same content with a new mtime: remember it so the hash is skipped next time
+    manifest.update(size=stat.st_size, mtime_ns=stat.st_mtime_ns)
+    try:
+        _write_manifest(manifest_path, manifest)
+    except OSError:
+        pass
+    return True
+
+
+def build_dataset(name, data_dir=DATA_DIR):
+    """Convert one source CSV into its Parquet file and return the frame"""
+    csv_path, parquet_path, manifest_path = _paths(name, data_dir)
+    stat = csv_path.stat()
+    df = layout.sort_frame(schema.apply_schema(pd.read_csv(csv_path)))
+
+    parquet_path.parent.mkdir(parents=True, exist_ok=True)
+    _write_atomic(parquet_path, lambda tmp: df.to_parquet(tmp, index=False))
+    _write_manifest(manifest_path, {
+        "format": STORE_FORMAT,
+        "source": csv_path.name,
+        "size": stat.st_size,
+        "mtime_ns": stat.st_mtime_ns,
+        "sha256": _file_hash(csv_path),
+        "rows": len(df),
+        "categories": schema.observed_categories(df),
+    })
+    return df
+
+
+def ensure_built(name, data_dir=DATA_DIR, force=False):
+    """Build one dataset if it is stale; returns whether it was rebuilt"""
+    if not force and is_fresh(name, data_dir):
+        return False
+    with _locked(data_dir):
+        # Another thread or process may have built it while we waited
+        if not force and is_fresh(name, data_dir):
+            return False
+        build_dataset(name, data_dir)
+        return True
+
+
+def build_store(data_dir=DATA_DIR, force=False):
+    """Build every stale dataset that has a CSV; returns the rebuilt names"""
+    rebuilt = []
+    for name in DATASETS:
+        csv_path, _, _ = _paths(name, data_dir)
+        if not csv_path.exists():
+            continue
+        if ensure_built(name, data_dir, force):
+            rebuilt.append(name)
+    return rebuilt
+
+
+def shared_vocabulary(data_dir=DATA_DIR):
+    """Category vocabularies merged from the manifests already in the store"""
+    vocabularies = []
+    for name in DATASETS:
+        _, _, manifest_path = _paths(name, data_dir)
+        manifest = _read_manifest(manifest_path) or {}
+        vocabularies.append(manifest.get("categories", {}))
+    return schema.merge_vocabularies(vocabularies)
+
+
+def load_dataset(name, data_dir=DATA_DIR):
+    """Load a typed dataset from the store, rebuilding it if its CSV changed"""
+    csv_path, parquet_path, _ = _paths(name, data_dir)
+    if not HAVE_PYARROW:
+        return schema.apply_schema(pd.read_csv(csv_path))
+
+    try:
+        if csv_path.exists():
+            ensure_built(name, data_dir)
+        vocabularies = shared_vocabulary(data_dir)
+    except OSError:
+        return schema.apply_schema(pd.read_csv(csv_path))
+    return schema.apply_schema(pd.read_parquet(parquet_path), vocabularies)
+
+
+if __name__ == "__main__":
+    force = "--force" in sys.argv[1:]
+    names = build_store(force=force)
+    print(f"Rebuilt: {', '.join(names)}" if names else "Store is up to date")
@@ -0,0 +1,33 @@
+"""HTML snippets for the page markup, styled by ``static/dashboard.css``.
+
+The pages used to spell out every card's inline ``style="..."`` attributes,
+which were sent again on each rerun. The templates emit short class-based
+markup instead; the look lives in the stylesheet the browser caches.
+"""
+
+
+def chart_card(title, text, *notes, variant='', close=False):
+    """White card with a centred title and explanation, opened for a chart.
+
+    ``variant`` picks the text colours and sizes (``'ink'``, ``'note'``,
+    ``'section'`` or ``''``). Extra ``notes`` become smaller left-aligned
+    paragraphs under the explanation. Unless ``close`` is set the ``div`` is
+    left open so the chart rendered next joins the card's bottom edge.
+    """
+    classes = ' '.join(filter(None, ['chart-card', variant,
+                                     'with-notes' if notes else '']))
+    html = f'<div class="{classes}"><h3>{title}</h3><p>{text}</p>'
+    html += ''.join(f'<p class="chart-note">{note}</p>' for note in notes)
+    if close:
+        html += '</div>'
+    return html
+
+
+def intro_box(title, text):
+    """Light box with a title and a paragraph introducing a page"""
+    return f'<div class="intro-box"><h4>{title}</h4><p>{text}</p></div>'
+
+
+def insight_box(title, text):
+    """Gradient box with a title and a paragraph summing up a page"""
+    return f'<div class="insight-box"><h4>{title}</h4><p>{text}</p></div>'
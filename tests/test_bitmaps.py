@@ -0,0 +1,106 @@
+"""Selections of BitmapIndex and OffsetTable against plain boolean filtering"""
+import random
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from crime_dashboard import layout
+from crime_dashboard.bitmaps import BitmapIndex
+
+SIZE = 5000
+
+
+@pytest.fixture(scope='module')
+def frame():
+    # Missing labels in every layout column, and an unindexed Geo column
+    rng = np.random.default_rng(0)
+
+    def column(values, categorical=True):
+        picked = rng.choice(np.array(values, dtype=object), SIZE)
+        return pd.Categorical(picked) if categorical else picked
+
+    return layout.sort_frame(pd.DataFrame({
+        'Region': column(['Africa', 'Americas', 'Asia', None]),
+        'Subregion': column(['North', 'South', 'East', None]),
+        'Year': rng.choice([2018.0, 2019.0, 2020.0, np.nan], SIZE),
+        'Category': column(['Theft', 'Fraud', 'Assault', None]),
+        'Geo': column(['A', 'B', 'C', 'D', None], categorical=False),
+    }))
+
+
+@pytest.fixture(scope='module')
+def table(frame):
+    return layout.OffsetTable(frame)
+
+
+def _mask(frame, filters):
+    keep = np.ones(len(frame), dtype=bool)
+    for column, value in filters.items():
+        if value is None:
+            continue
+        values = value if isinstance(value, list) else [value]
+        keep &= frame[column].isin(values).to_numpy()
+    return keep
+
+
+def _random_filters(frame, rng):
+    filters = {}
+    for column in ('Subregion', 'Year', 'Category', 'Geo'):
+        choices = frame[column].dropna().unique().tolist()
+        pick = rng.random()
+        if pick < 0.4:
+            filters[column] = rng.choice(choices)
+        elif pick < 0.55:
+            filters[column] = rng.sample(choices, 2)
+        elif pick < 0.6:
+            filters[column] = 'missing'
+    return filters
+
+
+@pytest.mark.parametrize('with_layout', [True, False])
+@pytest.mark.parametrize('region', [None, 'Africa', 'Americas', 'Asia',
+                                    ['Africa', 'Asia']])
+def test_select_matches_boolean_filtering(frame, table, with_layout, region):
+    index = BitmapIndex(frame, layout=table if with_layout else None)
+    view = index.restrict(Region=region)
+    if with_layout and region is not None:
+        # Whole-region views take the offset table path
+        assert view._regions is not None
+    rng = random.Random(0)
+    for _ in range(200):
+        filters = _random_filters(frame, rng)
+        expected = frame[_mask(frame, {'Region': region, **filters})]
+        selected = view.select(**filters)
+        assert selected.equals(expected), filters
+        assert selected.index.equals(expected.index), filters
+        assert view.count(**filters) == len(expected), filters
+
+
+def test_unfiltered_select_is_the_frame(frame, table):
+    index = BitmapIndex(frame, layout=table)
+    assert index.select() is frame
+    assert index.select(Subregion=None) is frame
+    assert index.count() == len(frame)
+
+
+def test_span_matches_boolean_filtering(frame, table):
+    columns = table.columns
+    for values in frame[columns].drop_duplicates().itertuples(index=False):
+        for depth in range(1, len(columns) + 1):
+            prefix = tuple(values[:depth])
+            if any(pd.isna(value) for value in prefix):
+                continue
+            start, stop = table.span(*prefix)
+            mask = _mask(frame, dict(zip(columns, prefix)))
+            assert np.flatnonzero(mask).tolist() == list(range(start, stop))
+
+
+def test_span_of_unknown_value_is_empty(table):
+    assert table.span('Oceania') == (0, 0)
+    assert table.span('Asia', 'Nowhere') == (0, 0)
+
+
+def test_offset_table_requires_sorted_frame(frame):
+    with pytest.raises(ValueError):
+        layout.OffsetTable(frame.iloc[::-1].reset_index(drop=True))
@@ -0,0 +1,64 @@
+"""CountCube rollups and totals against the raw rows"""
+import numpy as np
+import pandas as pd
+import pytest
+
+from crime_dashboard.cube import CountCube
+
+DIMS = ['Subregion', 'Category', 'Year']
+
+
+@pytest.fixture(scope='module')
+def frame():
+    rng = np.random.default_rng(0)
+    return pd.DataFrame({
+        'Subregion': pd.Categorical(rng.choice(['a', 'b', None], 500)),
+        'Category': pd.Categorical(rng.choice(['x', 'y', 'z', None], 500)),
+        'Year': rng.choice([2019, 2020, 2021], 500),
+    })
+
+
+def _slices(frame):
+    cube = CountCube.from_frame(frame, DIMS)
+    return [
+        (cube, frame),
+        (cube.slice(Year=2020), frame[frame['Year'] == 2020]),
+        (cube.slice(Category=['x', 'y']),
+         frame[frame['Category'].isin(['x', 'y'])]),
+        (cube.slice(Subregion='a', Year=[2019, 2021]),
+         frame[(frame['Subregion'] == 'a') & frame['Year'].isin([2019, 2021])]),
+    ]
+
+
+@pytest.mark.parametrize('dim', DIMS)
+def test_rollup_matches_value_counts(frame, dim):
+    for cube, rows in _slices(frame):
+        expected = rows[dim].value_counts()
+        expected = expected[expected > 0].sort_index()
+        got = cube.rollup(dim).set_index(dim)['count']
+        assert got.index.tolist() == expected.index.tolist()
+        assert got.tolist() == expected.tolist()
+
+
+@pytest.mark.parametrize('dim', ['Subregion', 'Category'])
+def test_rollup_leaves_out_missing_labels(frame, dim):
+    cube = CountCube.from_frame(frame, DIMS)
+    rolled = cube.rollup(dim)
+    assert not rolled[dim].isna().any()
+    assert rolled['count'].sum() == frame[dim].notna().sum()
+
+
+@pytest.mark.parametrize('dim', DIMS)
+def test_distinct_counts_missing_labels(frame, dim):
+    for cube, rows in _slices(frame):
+        assert cube.distinct(dim) == len(rows[dim].unique())
+
+
+def test_distinct_includes_nan(frame):
+    cube = CountCube.from_frame(frame, DIMS)
+    assert cube.distinct('Subregion') == frame['Subregion'].nunique() + 1
+
+
+def test_total_counts_rows_with_missing_labels(frame):
+    for cube, rows in _slices(frame):
+        assert cube.total() == len(rows)
@@ -0,0 +1,65 @@
+"""Frozen frames refuse every write that would reach other sessions"""
+import pandas as pd
+import pytest
+
+from crime_dashboard.frozen import freeze
+
+
+@pytest.fixture
+def frame():
+    df = pd.DataFrame({
+        'Country': pd.Categorical(['France', 'Peru', 'Japan']),
+        'Year': [2019, 2020, 2021],
+        'VALUE': [1.5, 2.5, 3.5],
+    })
+    df.attrs['source'] = 'store'
+    return freeze(df)
+
+
+MUTATIONS = {
+    'column assignment': lambda df: df.__setitem__('VALUE', 0),
+    'column insertion': lambda df: df.insert(0, 'New', 1),
+    'column deletion': lambda df: df.__delitem__('Year'),
+    'column pop': lambda df: df.pop('Year'),
+    'value write': lambda df: df.iloc.__setitem__((0, 2), 9.0),
+    'in-place fillna': lambda df: df.fillna(0, inplace=True),
+    'index replacement': lambda df: setattr(df, 'index', [7, 8, 9]),
+    'columns replacement': lambda df: setattr(df, 'columns', ['a', 'b', 'c']),
+    'index name': lambda df: setattr(df.index, 'name', 'row'),
+    'columns name': lambda df: setattr(df.columns, 'name', 'field'),
+    'attrs item': lambda df: df.attrs.__setitem__('source', 'x'),
+    'attrs deletion': lambda df: df.attrs.pop('source'),
+    'attrs update': lambda df: df.attrs.update(source='x'),
+    'attrs replacement': lambda df: setattr(df, 'attrs', {}),
+}
+
+
+@pytest.mark.parametrize('mutate', MUTATIONS.values(), ids=MUTATIONS.keys())
+def test_mutation_is_refused(frame, mutate):
+    before = frame.copy()
+    with pytest.raises((TypeError, ValueError, RuntimeError)):
+        mutate(frame)
+    pd.testing.assert_frame_equal(frame, before)
+    assert frame.index.name is None
+    assert frame.columns.name is None
+    assert frame.attrs == {'source': 'store'}
+
+
+def test_derived_frames_are_writable(frame):
+    derived = frame[frame['Year'] > 2019]
+    derived['VALUE'] = 0.0
+    derived.index.name = 'row'
+    derived.attrs['source'] = 'x'
+    assert type(derived) is pd.DataFrame
+    assert frame['VALUE'].tolist() == [1.5, 2.5, 3.5]
+    assert frame.index.name is None
+    assert frame.attrs == {'source': 'store'}
+
+
+def test_copies_carry_attrs_as_plain_dicts(frame):
+    copied = frame.copy()
+    assert copied.attrs == {'source': 'store'}
+    copied.attrs['source'] = 'x'
+    copied.index.name = 'row'
+    assert frame.attrs == {'source': 'store'}
+    assert frame.index.name is None